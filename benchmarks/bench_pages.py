@@ -0,0 +1,175 @@
+"""Startup and per-page render benchmark.
+
+Runs ``streamlit_app.py`` headlessly with Streamlit's ``AppTest`` once for
+each page of the sidebar radio and reports, per page:
+
+- wall time of the first render and of warm reruns (min / median),
+- number of elements emitted,
+- payload bytes (serialized element protos plus media files such as images),
+- peak Python memory allocated during a rerun.
+
+It also measures the cold import time of the app in a fresh interpreter.
+Results are written as JSON so runs from different commits can be compared::
+
+    python benchmarks/bench_pages.py --output bench.json
+    python benchmarks/bench_pages.py --baseline bench.json
+"""
+import argparse
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent.parent
+APP_SCRIPT = APP_DIR / "streamlit_app.py"
+
+# Metrics compared by --baseline, with the unit used to print them
+COMPARED = {
+    "first_render_s": "s",
+    "warm_median_s": "s",
+    "elements": "",
+    "payload_bytes": "B",
+    "peak_memory_bytes": "B",
+}
+
+
+def cold_import_time(repeat):
+    """Time ``import streamlit_app`` in fresh interpreters, in seconds."""
+    code = (
+        "import time, logging; logging.disable(logging.WARNING); "
+        "t = time.perf_counter(); import streamlit_app; "
+        "print(time.perf_counter() - t)"
+    )
+    times = []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", code], cwd=APP_DIR, check=True,
+            capture_output=True, text=True,
+        ).stdout
+        times.append(float(out.strip().splitlines()[-1]))
+    return min(times)
+
+
+def _walk(node):
+    for child in getattr(node, "children", {}).values():
+        yield child
+        yield from _walk(child)
+
+
+def measure_tree(at):
+    """Return (element count, serialized proto bytes) of the last run."""
+    elements = payload = 0
+    for node in _walk(at._tree):
+        proto = getattr(node, "proto", None)
+        if proto is None or hasattr(node, "children"):
+            continue
+        elements += 1
+        payload += proto.ByteSize()
+    return elements, payload
+
+
+def bench_page(page, repeat, timeout):
+    from streamlit.testing.v1 import AppTest
+
+    from portfolio.export import MediaCapture
+
+    at = AppTest.from_file(str(APP_SCRIPT), default_timeout=timeout)
+    start = time.perf_counter()
+    at.run()
+    radio = at.sidebar.radio[0]
+    if radio.value != page:
+        start = time.perf_counter()
+        radio.set_value(page).run()
+    first = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(f"{page}: {at.exception[0].message}")
+
+    warm = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        at.run()
+        warm.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    with MediaCapture() as media:
+        at.run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    elements, payload = measure_tree(at)
+    return {
+        "first_render_s": round(first, 4),
+        "warm_min_s": round(min(warm), 4),
+        "warm_median_s": round(statistics.median(warm), 4),
+        "elements": elements,
+        "payload_bytes": payload + media.total,
+        "media_bytes": media.total,
+        "peak_memory_bytes": peak,
+    }
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=APP_DIR, check=True,
+            capture_output=True, text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline):
+    """Print the relative change of each metric against a baseline run."""
+    print(f"{'page':<12}{'metric':<20}{'baseline':>14}{'current':>14}{'change':>10}")
+    for page, metrics in results["pages"].items():
+        before = baseline.get("pages", {}).get(page)
+        if not before:
+            continue
+        for name, unit in COMPARED.items():
+            old, new = before.get(name), metrics.get(name)
+            if old is None or new is None:
+                continue
+            change = f"{(new - old) / old:+.1%}" if old else "n/a"
+            print(f"{page:<12}{name:<20}{old:>13}{unit:1}{new:>13}{unit:1}{change:>10}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", nargs="*", help="pages to run (default: all)")
+    parser.add_argument("--repeat", type=int, default=5, help="warm reruns per page")
+    parser.add_argument("--import-repeat", type=int, default=3, help="cold import samples")
+    parser.add_argument("--timeout", type=float, default=60, help="per-run timeout in seconds")
+    parser.add_argument("--output", help="write the JSON results to this file")
+    parser.add_argument("--baseline", help="JSON results of an earlier run to compare with")
+    args = parser.parse_args(argv)
+
+    # AppTest does not add the app directory to sys.path like `streamlit run`
+    sys.path.insert(0, str(APP_DIR))
+    logging.disable(logging.WARNING)
+    from portfolio.pages import PAGES
+
+    results = {
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "cold_import_s": round(cold_import_time(args.import_repeat), 4),
+        "pages": {},
+    }
+    for page in args.pages or PAGES:
+        results["pages"][page] = bench_page(page, args.repeat, args.timeout)
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    if args.baseline:
+        compare(results, json.loads(Path(args.baseline).read_text(encoding="utf-8")))
+
+
+if __name__ == "__main__":
+    main()
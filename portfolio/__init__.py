@@ -0,0 +1 @@
+"""Support code for the Streamlit portfolio app (``streamlit_app.py``)."""
@@ -0,0 +1,224 @@
+"""Image asset pipeline.
+
+The project screenshots are stored at full resolution in the repository. This
+module pre-renders downscaled JPEG variants of them at a few fixed widths,
+keyed by the content hash of the source file, so pages can send the smallest
+variant that fits instead of the original PNG.
+
+Variants are written to ``.cache/variants`` next to the app (override with the
+``PORTFOLIO_CACHE_DIR`` environment variable). They can be built ahead of a
+deploy with::
+
+    python -m portfolio.assets
+
+Missing files are reported once per process (see ``missing_assets``) and
+replaced by a labeled placeholder drawn locally, so a missing screenshot never
+causes an error or a network request.
+"""
+import functools
+import hashlib
+import io
+import logging
+import os
+import sys
+from pathlib import Path
+
+import streamlit as st
+
+APP_DIR = Path(__file__).resolve().parent.parent
+CACHE_DIR = Path(os.environ.get("PORTFOLIO_CACHE_DIR", APP_DIR / ".cache"))
+VARIANT_DIR = CACHE_DIR / "variants"
+
+# Widths (in pixels) of the pre-rendered variants
+VARIANT_WIDTHS = (480, 800, 1200)
+VARIANT_QUALITY = 85
+
+# Screenshots are shown in half-width columns of the wide layout
+HALF_COLUMN_WIDTH = 800
+
+# Screenshots shown on the Projects page
+SCREENSHOTS = (
+    "895cb66e-da1d-4458-b5ec-2ae2dd25ae7b.png",
+    "3c4269e5-34ea-4ce5-b8d5-bdb45bad833c.png",
+    "239788e1-26f9-4c94-bcbf-7eb93fe76f59.png",
+    "e5130d9d-966d-451e-a050-f5b79a473dd2.png",
+)
+
+# Every image file the pages load
+ASSETS = SCREENSHOTS + ("profile.jpg",)
+
+PLACEHOLDER_BACKGROUND = (204, 204, 204)
+PLACEHOLDER_TEXT = (150, 150, 150)
+PLACEHOLDER_FONT = "DejaVuSans.ttf"
+
+logger = logging.getLogger(__name__)
+
+# (path, mtime_ns, size) -> digest, so unchanged files are hashed only once
+_hash_memo = {}
+
+
+def resolve(path):
+    """Resolve a path relative to the app directory."""
+    path = Path(path)
+    return path if path.is_absolute() else APP_DIR / path
+
+
+def content_hash(path):
+    """Return a short SHA-256 digest of the file's bytes."""
+    path = resolve(path)
+    stat = path.stat()
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    digest = _hash_memo.get(key)
+    if digest is None:
+        sha = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 16), b""):
+                sha.update(block)
+        digest = sha.hexdigest()[:16]
+        _hash_memo[key] = digest
+    return digest
+
+
+def _flatten(image):
+    # JPEG has no alpha channel, so composite transparent images onto white
+    from PIL import Image
+
+    if image.mode in ("RGBA", "LA", "P"):
+        image = image.convert("RGBA")
+        background = Image.new("RGB", image.size, (255, 255, 255))
+        background.paste(image, mask=image.getchannel("A"))
+        return background
+    return image.convert("RGB")
+
+
+def render_thumbnail(path, width):
+    """Decode an image and return it resized to ``width`` pixels as JPEG bytes."""
+    from PIL import Image
+
+    with Image.open(resolve(path)) as original:
+        image = _flatten(original)
+    if image.width > width:
+        height = round(image.height * width / image.width)
+        image = image.resize((width, height), Image.LANCZOS)
+    buffer = io.BytesIO()
+    image.save(buffer, "JPEG", quality=VARIANT_QUALITY, optimize=True)
+    return buffer.getvalue()
+
+
+@functools.lru_cache(maxsize=32)
+def render_placeholder(label, width=HALF_COLUMN_WIDTH, height=None):
+    """Return PNG bytes of a grey ``width`` x ``height`` box showing ``label``.
+
+    The height defaults to 16:9. Results are cached per (label, size).
+    """
+    from PIL import Image, ImageDraw, ImageFont
+
+    height = height or round(width * 9 / 16)
+    image = Image.new("RGB", (width, height), PLACEHOLDER_BACKGROUND)
+    try:
+        font = ImageFont.truetype(PLACEHOLDER_FONT, max(12, height // 10))
+    except OSError:
+        font = ImageFont.load_default()
+    draw = ImageDraw.Draw(image)
+    draw.text((width / 2, height / 2), label, fill=PLACEHOLDER_TEXT, font=font, anchor="mm")
+    buffer = io.BytesIO()
+    image.save(buffer, "PNG", optimize=True)
+    return buffer.getvalue()
+
+
+def build_variants(path, widths=VARIANT_WIDTHS):
+    """Write the missing variants of one image and return ``{width: path}``.
+
+    Widths larger than the original are clamped to the original width, so the
+    image is never upscaled.
+    """
+    from PIL import Image
+
+    source = resolve(path)
+    digest = content_hash(source)
+    variants = {}
+    image = None
+    with Image.open(source) as original:
+        src_width, src_height = original.size
+        for width in sorted({min(w, src_width) for w in widths}):
+            target = VARIANT_DIR / f"{digest}-{width}.jpg"
+            if not target.exists():
+                if image is None:
+                    image = _flatten(original)
+                height = round(src_height * width / src_width)
+                resized = image.resize((width, height), Image.LANCZOS)
+                VARIANT_DIR.mkdir(parents=True, exist_ok=True)
+                # Write to a temporary name first so concurrent workers never
+                # serve a half-written file
+                tmp = target.with_suffix(f".{os.getpid()}.tmp")
+                resized.save(tmp, "JPEG", quality=VARIANT_QUALITY, optimize=True, progressive=True)
+                os.replace(tmp, target)
+            variants[width] = target
+    return variants
+
+
+def build_all(paths=SCREENSHOTS, widths=VARIANT_WIDTHS):
+    """Build variants for every image; missing or unreadable files are skipped."""
+    catalog = {}
+    for path in paths:
+        try:
+            catalog[str(path)] = build_variants(path, widths)
+        except OSError:
+            continue
+    return catalog
+
+
+def pick_variant(path, catalog, width):
+    """Return the smallest variant at least ``width`` pixels wide.
+
+    Falls back to the largest variant, and to the original file when no
+    variants exist for it.
+    """
+    variants = catalog.get(str(path))
+    if not variants:
+        return str(resolve(path))
+    fitting = [w for w in variants if w >= width]
+    best = min(fitting) if fitting else max(variants)
+    return str(variants[best])
+
+
+@st.cache_resource(show_spinner=False)
+def load_image_variants():
+    """Build the screenshot variants once per process."""
+    return build_all()
+
+
+@st.cache_resource(show_spinner=False)
+def missing_assets():
+    """Check the image files once per process and log the missing ones."""
+    missing = frozenset(str(path) for path in ASSETS if not resolve(path).is_file())
+    for path in sorted(missing):
+        logger.warning("Image %s is missing; a placeholder is shown instead", path)
+    return missing
+
+
+def screenshot(path, width=HALF_COLUMN_WIDTH, placeholder=None):
+    """Return the file to send for a screenshot shown ``width`` pixels wide.
+
+    A missing file is replaced by a placeholder labeled ``placeholder``.
+    """
+    if str(path) in missing_assets():
+        return render_placeholder(placeholder or Path(path).stem, width)
+    return pick_variant(path, load_image_variants(), width)
+
+
+# Resized thumbnails are shared by all sessions. Entries are keyed by content
+# hash, so identical files share one entry and edited files get a new one.
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _cached_thumbnail(digest, width, _path):
+    return render_thumbnail(_path, width)
+
+
+def thumbnail(path, width):
+    """Return JPEG bytes of the image resized to ``width`` pixels."""
+    return _cached_thumbnail(content_hash(path), width, path)
+
+
+if __name__ == "__main__":
+    for name, variants in build_all(sys.argv[1:] or SCREENSHOTS).items():
+        print(f"{name}: " + ", ".join(f"{w}px" for w in sorted(variants)))
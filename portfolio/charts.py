@@ -0,0 +1,172 @@
+"""Plotly figures for the portfolio pages.
+
+Every chart is drawn from constant data, so instead of rebuilding a
+``go.Figure`` on each rerun the figures are registered here by name. A figure
+is built once per (name, data, theme) and reused by every session. Only the
+construction is cached: ``st.plotly_chart`` still validates and serializes
+the shared figure on each render, and has no public way to take a
+pre-serialized spec.
+"""
+import functools
+
+import plotly.graph_objects as go
+import streamlit as st
+
+from portfolio import metrics
+
+# Colour themes, matching the CSS variables of the app
+THEMES = {
+    "light": {
+        "primary": "#1E40AF",
+        "secondary": "#3B82F6",
+        "accent": "#60A5FA",
+        "light": "#93C5FD",
+        "indigo": "#4F46E5",
+        "positive": "#10B981",
+        "negative": "#DC2626",
+        "steps": ("#EFF6FF", "#DBEAFE", "#BFDBFE", "#93C5FD"),
+    },
+}
+DEFAULT_THEME = "light"
+
+_builders = {}
+
+
+def register(name):
+    """Register a figure builder under ``name``."""
+    def decorator(builder):
+        _builders[name] = builder
+        return builder
+    return decorator
+
+
+@register("retrieval_time")
+def _retrieval_time(colors, labels, values):
+    fig = go.Figure(data=[
+        go.Bar(
+            x=labels,
+            y=values,
+            marker_color=[colors["primary"], colors["secondary"]],
+            text=values,
+            textposition='auto',
+        )
+    ])
+
+    fig.update_layout(
+        title='Information Retrieval Time (minutes)',
+        xaxis_title='Method',
+        yaxis_title='Minutes',
+        plot_bgcolor='rgba(0,0,0,0)',
+        height=400,
+        margin=dict(l=20, r=20, t=40, b=20),
+    )
+    return fig
+
+
+@register("response_time")
+def _response_time(colors, labels, values):
+    fig = go.Figure()
+
+    fig.add_trace(go.Bar(
+        x=labels,
+        y=values,
+        marker_color=[colors["negative"], colors["positive"]],
+        text=[f"{val} days" for val in values],
+        textposition='auto',
+    ))
+
+    fig.update_layout(
+        title='Response Time Improvement',
+        xaxis_title='Implementation Phase',
+        yaxis_title='Days',
+        plot_bgcolor='rgba(0,0,0,0)',
+        height=400,
+        margin=dict(l=20, r=20, t=40, b=20),
+    )
+    return fig
+
+
+@register("cost_reduction")
+def _cost_reduction(colors, value, maximum):
+    steps = colors["steps"]
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=value,
+        title={'text': "Average Cost Reduction (%)"},
+        gauge={
+            'axis': {'range': [None, maximum]},
+            'bar': {'color': colors["positive"]},
+            'steps': [
+                {'range': [0, 10], 'color': steps[0]},
+                {'range': [10, 20], 'color': steps[1]},
+                {'range': [20, 30], 'color': steps[2]},
+                {'range': [30, maximum], 'color': steps[3]}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': value
+            }
+        },
+        number={'suffix': "%"}
+    ))
+
+    fig.update_layout(
+        height=300,
+        margin=dict(l=20, r=20, t=50, b=20),
+    )
+    return fig
+
+
+@register("skills_evolution")
+def _skills_evolution(colors, years, series):
+    fig = go.Figure()
+
+    for (name, values), color in zip(series, (colors["primary"], colors["indigo"], colors["accent"])):
+        fig.add_trace(go.Scatter(
+            x=years,
+            y=values,
+            mode='lines+markers',
+            name=name,
+            line=dict(color=color, width=3),
+            marker=dict(size=8)
+        ))
+
+    fig.update_layout(
+        title='Professional Skills Development Over Time',
+        xaxis_title='Year',
+        yaxis_title='Proficiency Level (%)',
+        legend_title='Skill Category',
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        yaxis=dict(range=[0, 100]),
+        height=500,
+        margin=dict(l=20, r=20, t=40, b=20),
+    )
+    return fig
+
+
+def _freeze(value):
+    # Make list/dict arguments hashable so they can be part of the cache key
+    if isinstance(value, dict):
+        return tuple((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+@functools.lru_cache(maxsize=64)
+def _build(name, theme, data):
+    return _builders[name](THEMES[theme], **dict(data))
+
+
+def get_figure(name, theme=DEFAULT_THEME, **data):
+    """Return the cached figure. Treat it as read-only: it is shared."""
+    return _build(name, theme, _freeze(data))
+
+
+def plotly_chart(name, theme=DEFAULT_THEME, use_container_width=True, **data):
+    """Render a registered figure with ``st.plotly_chart``; the figure is
+    built once and shared, not rebuilt on every rerun."""
+    with metrics.timed(f"chart:{name}"):
+        st.plotly_chart(get_figure(name, theme, **data), use_container_width=use_container_width, theme="streamlit")
@@ -0,0 +1,149 @@
+"""HTML for the repeated page components.
+
+Every component is a ``Template``: a format string parsed once at import into
+literal chunks and field names, so rendering is a single join. Text fields are
+HTML-escaped; fields whose name ends in ``_html`` take markup that is already
+safe and are inserted as is.
+
+The helpers render a whole section (every skill bar of a group, every card of
+a column, every tag of a list) as one HTML string, so the section is sent to
+the browser as a single markdown element instead of one element per item.
+Their output is memoized on the arguments.
+"""
+import functools
+import html
+import string
+
+
+class Template:
+    """A precompiled ``str.format``-style template with escaped fields."""
+
+    def __init__(self, source):
+        self.source = source
+        self._parts = []
+        for literal, field, _, _ in string.Formatter().parse(source):
+            if literal:
+                self._parts.append((literal, None, False))
+            if field is not None:
+                self._parts.append((None, field, not field.endswith("_html")))
+
+    def render(self, **fields):
+        out = []
+        for literal, field, escape in self._parts:
+            if field is None:
+                out.append(literal)
+            else:
+                value = fields[field]
+                out.append(html.escape(str(value)) if escape else value)
+        return "".join(out)
+
+
+HEADER = Template('<div class="header-container"><h1>{title}</h1>{subtitle_html}<p>{text}</p></div>')
+CARD = Template('<div class="card"{attrs_html}><h4>{title}</h4><p>{text}</p>{detail_html}</div>')
+TEXT_CARD = Template('<div class="card"><p>{text}</p></div>')
+CARD_DETAIL = Template('<p style="color: #6c757d;">{detail}</p>')
+PROJECT_CARD = Template('<div class="project-card"><h3>{icon} {title}</h3></div>')
+TIMELINE_ITEM = Template(
+    '<div class="timeline-item"><h4>{title}</h4><h5>{company}</h5><p class="timeline-date">{dates}</p></div>'
+)
+METRIC_BOX = Template(
+    '<div class="metric-box"><div class="metric-value">{value}</div><div class="metric-label">{label}</div></div>'
+)
+SKILL_CONTAINER = Template(
+    '<div class="skill-container">'
+    '<div style="display: flex; justify-content: space-between;"><span>{name}</span><span>{level}%</span></div>'
+    '<div class="skill-bar"><div class="skill-fill animate-skill" style="width: {level}%;"></div></div>'
+    '</div>'
+)
+LANGUAGES_CARD = Template(
+    '<div class="card"><h3>Languages</h3>'
+    '<div style="display: flex; flex-wrap: wrap; gap: 2rem; justify-content: space-around;">{items_html}</div>'
+    '</div>'
+)
+LANGUAGE = Template('<div style="flex: 1; min-width: 150px; text-align: center;"><h4>{name}</h4><p>{proficiency}</p></div>')
+TAG = Template('<span class="tag">{name}</span>')
+
+
+def _attrs(css_class=None, style=None):
+    attrs = ""
+    if css_class:
+        attrs += f' class="{html.escape(css_class)}"'
+    if style:
+        attrs += f' style="{html.escape(style)}"'
+    return attrs
+
+
+@functools.lru_cache(maxsize=32)
+def header(title, text, subtitle=None):
+    """Page header: title, optional ``<h3>`` subtitle and a line of text."""
+    subtitle_html = f"<h3>{html.escape(subtitle)}</h3>" if subtitle else ""
+    return HEADER.render(title=title, subtitle_html=subtitle_html, text=text)
+
+
+@functools.lru_cache(maxsize=128)
+def _cards(items, attrs_html):
+    return "".join(
+        CARD.render(title=title, text=text, attrs_html=attrs_html,
+                    detail_html=CARD_DETAIL.render(detail=detail) if detail else "")
+        for title, text, detail in items
+    )
+
+
+def cards(items, style=None):
+    """Render ``(title, text[, detail])`` items as consecutive ``.card`` blocks."""
+    items = tuple((item[0], item[1], item[2] if len(item) > 2 else None) for item in items)
+    return _cards(items, _attrs(style=style))
+
+
+@functools.lru_cache(maxsize=32)
+def text_card(text):
+    return TEXT_CARD.render(text=text)
+
+
+@functools.lru_cache(maxsize=128)
+def project_card(icon, title):
+    return PROJECT_CARD.render(icon=icon, title=title)
+
+
+@functools.lru_cache(maxsize=128)
+def timeline_item(title, company, dates):
+    return TIMELINE_ITEM.render(title=title, company=company, dates=dates)
+
+
+@functools.lru_cache(maxsize=128)
+def metric_box(value, label):
+    return METRIC_BOX.render(value=value, label=label)
+
+
+@functools.lru_cache(maxsize=128)
+def _skill_bars(items):
+    return "".join(SKILL_CONTAINER.render(name=name, level=level) for name, level in items)
+
+
+def skill_bars(skills):
+    """Render a ``{name: level}`` mapping as a block of skill bars."""
+    return _skill_bars(tuple(skills.items()))
+
+
+@functools.lru_cache(maxsize=32)
+def _languages_card(items):
+    return LANGUAGES_CARD.render(items_html="".join(
+        LANGUAGE.render(name=name, proficiency=proficiency) for name, proficiency in items
+    ))
+
+
+def languages_card(proficiency):
+    """Render a ``{language: proficiency}`` mapping as one card."""
+    return _languages_card(tuple(proficiency.items()))
+
+
+@functools.lru_cache(maxsize=128)
+def _tags(names, wrapper):
+    # Whitespace between the inline-block tags is part of their spacing
+    spans = " ".join(TAG.render(name=name) for name in names)
+    return f'<div{wrapper}>{spans}</div>'
+
+
+def tags(names, css_class=None, style=None):
+    """Render a list of names as tags inside a single wrapping ``<div>``."""
+    return _tags(tuple(names), _attrs(css_class, style))
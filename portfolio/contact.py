@@ -0,0 +1,388 @@
+"""Delivery pipeline for the contact form.
+
+A submitted message is first written to an outbox table in SQLite (WAL
+journal, ``synchronous=NORMAL``): the insert is a sub-millisecond local write
+with no fsync, and the message survives a crash or restart of the worker once
+it is acknowledged. A background thread then delivers pending messages in
+batches to a sink and retries failed batches with exponential backoff.
+
+Before anything is queued, ``submit`` drops submissions from sessions or
+client IPs that exceed their token bucket, and exact resubmissions of a
+recent message. Outcomes are counted as ``portfolio_contact_submissions_total``
+in ``portfolio.metrics``.
+
+The sink is chosen with the ``PORTFOLIO_CONTACT_SINK`` environment variable:
+
+- a file path (default ``.cache/mailbox.jsonl``): append one JSON line per
+  message, fsynced once per batch, as a local stand-in for a mail server;
+- ``http://...`` or ``https://...``: POST each batch as a JSON array;
+- ``smtp://host[:port]``: send each message as an email to
+  ``PORTFOLIO_CONTACT_TO`` (sender ``PORTFOLIO_CONTACT_FROM``).
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import smtplib
+import sqlite3
+import threading
+import time
+import urllib.request
+from email.message import EmailMessage
+from pathlib import Path
+from urllib.parse import urlparse
+
+import streamlit as st
+
+from portfolio import metrics
+from portfolio.assets import CACHE_DIR
+from portfolio.ratelimit import RecentSet, TokenBucketLimiter
+
+OUTBOX_PATH = CACHE_DIR / "contact.sqlite3"
+DEFAULT_MAILBOX = CACHE_DIR / "mailbox.jsonl"
+
+BATCH_SIZE = 50
+POLL_INTERVAL = 5.0
+# A claimed batch is retried by another worker if not delivered in time
+LEASE_SECONDS = 60.0
+LINGER_SECONDS = 0.5
+MAX_BACKOFF = 3600.0
+HTTP_TIMEOUT = 10.0
+
+# (tokens per second, burst): 3 messages per session, then one a minute;
+# 10 per client IP, then one every five minutes
+SESSION_LIMIT = (1 / 60, 3)
+CLIENT_LIMIT = (1 / 300, 10)
+RECENT_MESSAGES = 4096
+# Take the client IP from X-Forwarded-For (only behind a trusted proxy)
+TRUST_PROXY = os.environ.get("PORTFOLIO_TRUST_PROXY", "").lower() in ("1", "true", "yes", "on")
+
+FIELDS = ("name", "email", "subject", "message")
+# Address the messages are for (SMTP sink, and the static export's fallback)
+RECIPIENT = os.environ.get("PORTFOLIO_CONTACT_TO", "viniciuspaschoa1@hotmail.com")
+EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created REAL NOT NULL,
+    payload TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt REAL NOT NULL DEFAULT 0,
+    delivered REAL,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS outbox_pending ON outbox (next_attempt) WHERE delivered IS NULL;
+"""
+
+
+def validate(message):
+    """Return an error string for an invalid submission, or None."""
+    if not all(message.get(field, "").strip() for field in FIELDS):
+        return "Please fill in all fields before submitting."
+    if not EMAIL_PATTERN.match(message["email"].strip()):
+        return "Please enter a valid email address."
+    return None
+
+
+class MailboxSink:
+    """Appends messages to a JSON Lines file, one fsync per batch."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    def send(self, messages):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            for message in messages:
+                f.write(json.dumps(message, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+
+class WebhookSink:
+    """POSTs each batch as a JSON array."""
+
+    def __init__(self, url, timeout=HTTP_TIMEOUT):
+        self.url = url
+        self.timeout = timeout
+
+    def send(self, messages):
+        body = json.dumps(messages, ensure_ascii=False).encode("utf-8")
+        request = urllib.request.Request(
+            self.url, data=body, method="POST",
+            headers={"Content-Type": "application/json"},
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+
+class SmtpSink:
+    """Sends every message of a batch over one SMTP connection."""
+
+    def __init__(self, host, port, sender, recipient, timeout=HTTP_TIMEOUT):
+        self.host = host
+        self.port = port
+        self.sender = sender
+        self.recipient = recipient
+        self.timeout = timeout
+
+    def send(self, messages):
+        with smtplib.SMTP(self.host, self.port, timeout=self.timeout) as smtp:
+            for message in messages:
+                email = EmailMessage()
+                email["From"] = self.sender
+                email["To"] = self.recipient
+                email["Reply-To"] = message["email"]
+                email["Subject"] = f"[Portfolio] {message['subject']}"
+                email.set_content(f"From: {message['name']} <{message['email']}>\n\n{message['message']}")
+                smtp.send_message(email)
+
+
+def make_sink(spec=None):
+    """Build the sink described by ``spec`` (see the module docstring)."""
+    spec = spec or os.environ.get("PORTFOLIO_CONTACT_SINK") or str(DEFAULT_MAILBOX)
+    url = urlparse(spec)
+    if url.scheme in ("http", "https"):
+        return WebhookSink(spec)
+    if url.scheme == "smtp":
+        return SmtpSink(
+            url.hostname or "localhost", url.port or 25,
+            os.environ.get("PORTFOLIO_CONTACT_FROM", "portfolio@localhost"),
+            RECIPIENT,
+        )
+    return MailboxSink(spec)
+
+
+class Outbox:
+    """Durable queue of contact messages with a background delivery thread."""
+
+    def __init__(self, path=OUTBOX_PATH, sink=None, batch_size=BATCH_SIZE, poll_interval=POLL_INTERVAL):
+        self.path = Path(path)
+        self.sink = sink or make_sink()
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._db = self._connect()
+        self._db.executescript(_SCHEMA)
+
+    def _connect(self):
+        db = sqlite3.connect(self.path, timeout=10, check_same_thread=False, isolation_level=None)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        return db
+
+    def put(self, message):
+        """Queue a validated message and return its id."""
+        payload = {field: message[field].strip() for field in FIELDS}
+        payload["submitted_at"] = time.time()
+        with self._lock:
+            cursor = self._db.execute(
+                "INSERT INTO outbox (created, payload) VALUES (?, ?)",
+                (payload["submitted_at"], json.dumps(payload, ensure_ascii=False)),
+            )
+        self._wake.set()
+        return cursor.lastrowid
+
+    def pending(self):
+        """Number of messages not delivered yet."""
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM outbox WHERE delivered IS NULL").fetchone()[0]
+
+    def start(self):
+        """Start the delivery thread (idempotent)."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="contact-outbox", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _claim(self, db):
+        # Lease a batch so that other app processes sharing the file skip it
+        now = time.time()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            rows = db.execute(
+                "SELECT id, payload, attempts FROM outbox"
+                " WHERE delivered IS NULL AND next_attempt <= ? ORDER BY id LIMIT ?",
+                (now, self.batch_size),
+            ).fetchall()
+            if rows:
+                db.executemany(
+                    "UPDATE outbox SET next_attempt = ? WHERE id = ?",
+                    [(now + LEASE_SECONDS, row[0]) for row in rows],
+                )
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        return rows
+
+    def _deliver(self, db):
+        # Deliver one batch; return the number of messages delivered
+        rows = self._claim(db)
+        if not rows:
+            return 0
+        try:
+            self.sink.send([json.loads(payload) for _, payload, _ in rows])
+        except Exception as e:
+            logger.warning("Contact delivery of %d message(s) failed: %s", len(rows), e)
+            now = time.time()
+            db.executemany(
+                "UPDATE outbox SET attempts = ?, next_attempt = ?, last_error = ? WHERE id = ?",
+                [(attempts + 1, now + min(MAX_BACKOFF, 2 ** attempts * self.poll_interval), str(e), id_)
+                 for id_, _, attempts in rows],
+            )
+            return 0
+        now = time.time()
+        db.executemany(
+            "UPDATE outbox SET delivered = ?, last_error = NULL WHERE id = ?",
+            [(now, id_) for id_, _, _ in rows],
+        )
+        return len(rows)
+
+    def flush(self):
+        """Deliver every due message now; return how many were delivered."""
+        db = self._connect()
+        try:
+            total = 0
+            while True:
+                delivered = self._deliver(db)
+                total += delivered
+                if delivered < self.batch_size:
+                    return total
+        finally:
+            db.close()
+
+    def _run(self):
+        # The delivery thread uses its own connection
+        db = self._connect()
+        while not self._stop.is_set():
+            try:
+                delivered = self._deliver(db)
+            except sqlite3.Error as e:
+                logger.warning("Contact outbox error: %s", e)
+                delivered = 0
+            if delivered < self.batch_size:
+                if self._wake.wait(self.poll_interval):
+                    # Give the rest of a burst of submissions time to arrive
+                    self._stop.wait(LINGER_SECONDS)
+                self._wake.clear()
+        db.close()
+
+
+@st.cache_resource(show_spinner=False)
+def get_outbox():
+    """The process-wide outbox, with its delivery thread running."""
+    return Outbox().start()
+
+
+class SubmissionGuard:
+    """Rate limits per session and client IP, plus recent message hashes."""
+
+    def __init__(self):
+        self.sessions = TokenBucketLimiter(*SESSION_LIMIT)
+        self.clients = TokenBucketLimiter(*CLIENT_LIMIT)
+        self.recent = RecentSet(RECENT_MESSAGES)
+        self._lock = threading.Lock()
+
+    def allow(self, session_id, client_ip, spend=True):
+        if not self.sessions.allow(session_id, spend=spend):
+            return False
+        return client_ip is None or self.clients.allow(client_ip, spend=spend)
+
+    def reserve(self, key, session_id, client_ip):
+        """Remember the message hash ``key`` and spend its rate-limit tokens,
+        as one step; return ``"duplicate"`` or ``"rate_limited"`` if refused,
+        else None."""
+        with self._lock:
+            if self.recent.check_and_add(key, add=False):
+                return "duplicate"
+            if not self.allow(session_id, client_ip, spend=False):
+                return "rate_limited"
+            self.allow(session_id, client_ip)
+            self.recent.check_and_add(key)
+        return None
+
+    def release(self, key, session_id, client_ip):
+        """Undo ``reserve`` for a message that could not be queued."""
+        with self._lock:
+            self.recent.discard(key)
+            self.sessions.refund(session_id)
+            if client_ip is not None:
+                self.clients.refund(client_ip)
+
+
+@st.cache_resource(show_spinner=False)
+def get_guard():
+    """The process-wide submission guard."""
+    return SubmissionGuard()
+
+
+def client_identity():
+    """Return ``(session id, client IP)`` of the current script run."""
+    from streamlit import runtime
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    if ctx is None:
+        return None, None
+    client_ip = None
+    if runtime.exists():
+        client = runtime.get_instance().get_client(ctx.session_id)
+        request = getattr(client, "request", None)
+        if request is not None:
+            client_ip = request.remote_ip
+            forwarded = request.headers.get("X-Forwarded-For")
+            if TRUST_PROXY and forwarded:
+                client_ip = forwarded.split(",")[0].strip()
+    return ctx.session_id, client_ip
+
+
+def message_hash(submission):
+    normalized = [submission[field].strip() for field in FIELDS]
+    normalized[1] = normalized[1].lower()
+    return hashlib.sha256("\x1f".join(normalized).encode("utf-8")).digest()
+
+
+def submit(submission):
+    """Check and queue a submission; return ``(level, text)`` to show.
+
+    A valid message is remembered and spends its rate-limit token before it
+    is queued, so concurrent submissions cannot both pass the checks; if it
+    fails to queue, both are given back and it can be sent again. An invalid
+    one spends nothing, so fixing a typo and resubmitting is not rate limited.
+    """
+    guard = get_guard()
+    error = validate(submission)
+    if error:
+        metrics.increment("contact_submissions", outcome="invalid")
+        return "error", error
+    key = message_hash(submission)
+    identity = client_identity()
+    refused = guard.reserve(key, *identity)
+    if refused == "duplicate":
+        metrics.increment("contact_submissions", outcome="duplicate")
+        return "info", "This message was already received. Thank you!"
+    if refused == "rate_limited":
+        metrics.increment("contact_submissions", outcome="rate_limited")
+        return "error", "Too many messages in a short time. Please try again in a few minutes."
+    try:
+        get_outbox().put(submission)
+    except Exception:
+        guard.release(key, *identity)
+        raise
+    metrics.increment("contact_submissions", outcome="accepted")
+    return "success", "Thank you for your message! I'll get back to you soon."
@@ -0,0 +1,332 @@
+"""Portfolio content.
+
+The text of the pages (profile, education, languages, experience, skills,
+certifications, technologies and projects) lives in ``content.json`` next to
+this module (override with ``PORTFOLIO_CONTENT``). ``get_content`` loads and
+validates the file once and compiles it into immutable, render-ready values:
+HTML fragments are rendered (and escaped) with the ``components`` templates at
+compile time, chart data is frozen into the hashable form ``charts`` caches
+on, and the Key Metrics are aggregated into a ``Summary``.
+
+The file's mtime and size are checked on every call (see ``hotreload``), so
+an edit is picked up by the next rerun of every session without restarting
+the app. An edit that does not validate is logged and the previous content
+stays in use.
+"""
+import datetime
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import NamedTuple
+
+from portfolio import components, hotreload
+
+CONTENT_PATH = Path(os.environ.get("PORTFOLIO_CONTENT", Path(__file__).with_name("content.json")))
+
+
+class ContentError(ValueError):
+    """The content file is missing a field or has a value of the wrong type."""
+
+
+class Screenshot(NamedTuple):
+    file: str
+    caption: str
+    placeholder: str
+
+
+class Chart(NamedTuple):
+    name: str
+    data: tuple  # ((argument, frozen value), ...)
+
+    @property
+    def kwargs(self):
+        return dict(self.data)
+
+
+class Project(NamedTuple):
+    key: str
+    header_html: str
+    summary: str
+    features_md: str
+    impact: str
+    tags_html: str
+    screenshots: tuple
+    chart: Chart
+    demo: str  # module with a render() function, or None
+
+
+class TimelineEntry(NamedTuple):
+    header_html: str
+    summary: str
+    highlights_title: str
+    highlights_md: str
+
+
+class SkillGroup(NamedTuple):
+    key: str
+    title: str
+    bars_html: str
+
+
+class Summary(NamedTuple):
+    """Aggregates behind the Key Metrics, computed when the content is compiled."""
+    career_start: datetime.date
+    project_count: int
+    language_count: int
+    postgraduate_count: int
+
+    def years_experience(self, today=None):
+        today = today or datetime.date.today()
+        months = (today.year - self.career_start.year) * 12 + today.month - self.career_start.month
+        return max(0, months // 12)
+
+    def key_metrics(self, today=None):
+        """``(value, label)`` pairs for the Key Metrics boxes."""
+        return (
+            (f"{self.years_experience(today)}+", "Years Experience"),
+            (str(self.project_count), "AI Projects"),
+            (str(self.language_count), "Languages"),
+            (str(self.postgraduate_count), "Postgraduate Degrees"),
+        )
+
+
+class Content(NamedTuple):
+    version: str
+    header_html: str
+    about_html: str
+    summary: Summary
+    education_html: tuple
+    language_bars_html: str
+    languages_card_html: str
+    timeline: tuple
+    achievements_html: tuple
+    skills_evolution: Chart
+    technical_skills: tuple
+    business_skills: tuple
+    certifications_html: tuple
+    technologies_html: str
+    projects: tuple
+
+
+# -- validation ---------------------------------------------------------------
+
+def _field(obj, key, kind, where, optional=False):
+    return hotreload.field(obj, key, kind, where, ContentError, optional)
+
+
+def _items(obj, key, kind, where, optional=False):
+    values = _field(obj, key, list, where, optional)
+    if values is None:
+        return []
+    for i, value in enumerate(values):
+        if not isinstance(value, kind) or isinstance(value, bool):
+            raise ContentError(f"{where}.{key}[{i}]: expected {kind.__name__}")
+    return values
+
+
+# English month names of content.json dates, independent of the process locale
+_MONTHS = {name: number for number, name in enumerate(
+    ("January", "February", "March", "April", "May", "June",
+     "July", "August", "September", "October", "November", "December"), start=1)}
+EDUCATION_LEVELS = ("postgraduate", "bachelor", "course")
+
+
+def _start_date(period, where):
+    # "April 2025 - Present", "January 2021 - April 2025" or "2015 - 2020"
+    start = period.split(" - ")[0].split()
+    try:
+        if len(start) == 1:
+            return datetime.date(int(start[0]), 1, 1)
+        if len(start) == 2 and start[0] in _MONTHS:
+            return datetime.date(int(start[1]), _MONTHS[start[0]], 1)
+    except ValueError:
+        pass
+    raise ContentError(f"{where}.dates: expected 'Month YYYY - ...' or 'YYYY - ...', got {period!r}")
+
+
+def _levels(obj, where):
+    levels = _field(obj, "levels", dict, where)
+    for name, level in levels.items():
+        if not isinstance(level, int) or isinstance(level, bool) or not 0 <= level <= 100:
+            raise ContentError(f"{where}.levels.{name}: expected an integer from 0 to 100")
+    return levels
+
+
+# -- compilation --------------------------------------------------------------
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return tuple((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _bullets(items):
+    return "\n".join(f"- {item}" for item in items)
+
+
+def _halves(items):
+    # Split cards between two columns, one HTML block per column
+    middle = (len(items) + 1) // 2
+    return components.cards(items[:middle]), components.cards(items[middle:])
+
+
+def _compile_project(project, where):
+    key = _field(project, "key", str, where)
+    icon = _field(project, "icon", str, where)
+    title = _field(project, "title", str, where)
+    screenshots = []
+    for i, shot in enumerate(_items(project, "screenshots", dict, where, optional=True)):
+        shot_where = f"{where}.screenshots[{i}]"
+        screenshots.append(Screenshot(
+            _field(shot, "file", str, shot_where),
+            _field(shot, "caption", str, shot_where),
+            _field(shot, "placeholder", str, shot_where),
+        ))
+    chart = _field(project, "chart", dict, where, optional=True)
+    if chart is not None:
+        chart = Chart(_field(chart, "name", str, f"{where}.chart"),
+                      _freeze(_field(chart, "data", dict, f"{where}.chart")))
+    return Project(
+        key=key,
+        header_html=components.project_card(icon, title),
+        summary=_field(project, "summary", str, where),
+        features_md=_bullets(_items(project, "features", str, where)),
+        impact=_field(project, "impact", str, where),
+        tags_html=components.tags(_items(project, "tags", str, where)),
+        screenshots=tuple(screenshots),
+        chart=chart,
+        demo=_field(project, "demo", str, where, optional=True),
+    )
+
+
+def _compile_skill_groups(skills, section):
+    groups = []
+    for i, group in enumerate(_items(skills, section, dict, "skills")):
+        where = f"skills.{section}[{i}]"
+        groups.append(SkillGroup(
+            _field(group, "key", str, where),
+            _field(group, "title", str, where),
+            components.skill_bars(_levels(group, where)),
+        ))
+    return tuple(groups)
+
+
+def compile_content(data, version=""):
+    """Validate parsed content and compile it; raises ``ContentError``."""
+    profile = _field(data, "profile", dict, "content")
+    name = _field(profile, "name", str, "profile")
+    header_html = components.header(
+        name, _field(profile, "location", str, "profile"), subtitle=_field(profile, "headline", str, "profile"),
+    )
+    about_html = components.text_card(_field(profile, "about", str, "profile"))
+
+    education = []
+    postgraduate_count = 0
+    for i, item in enumerate(_items(data, "education", dict, "content")):
+        where = f"education[{i}]"
+        level = _field(item, "level", str, where)
+        if level not in EDUCATION_LEVELS:
+            raise ContentError(f"{where}.level: expected one of {', '.join(EDUCATION_LEVELS)}")
+        postgraduate_count += level == "postgraduate"
+        education.append((_field(item, "school", str, where), _field(item, "degree", str, where),
+                          _field(item, "dates", str, where)))
+
+    levels = {}
+    proficiency = {}
+    for i, language in enumerate(_items(data, "languages", dict, "content")):
+        where = f"languages[{i}]"
+        name = _field(language, "name", str, where)
+        levels[name] = _field(language, "level", int, where)
+        proficiency[name] = _field(language, "proficiency", str, where)
+
+    timeline = []
+    starts = []
+    for i, entry in enumerate(_items(data, "experience", dict, "content")):
+        where = f"experience[{i}]"
+        starts.append(_start_date(_field(entry, "dates", str, where), where))
+        timeline.append(TimelineEntry(
+            header_html=components.timeline_item(
+                _field(entry, "title", str, where), _field(entry, "company", str, where),
+                _field(entry, "dates", str, where),
+            ),
+            summary=_field(entry, "summary", str, where),
+            highlights_title=_field(entry, "highlights_title", str, where, optional=True),
+            highlights_md=_bullets(_items(entry, "highlights", str, where, optional=True)),
+        ))
+
+    achievements = [
+        (_field(item, "title", str, f"achievements[{i}]"), _field(item, "text", str, f"achievements[{i}]"))
+        for i, item in enumerate(_items(data, "achievements", dict, "content"))
+    ]
+
+    evolution = _field(data, "skills_evolution", dict, "content")
+    series = []
+    for i, item in enumerate(_items(evolution, "series", dict, "skills_evolution")):
+        where = f"skills_evolution.series[{i}]"
+        series.append((_field(item, "name", str, where), tuple(_items(item, "values", int, where))))
+    skills_evolution = Chart("skills_evolution", (
+        ("years", tuple(_items(evolution, "years", int, "skills_evolution"))),
+        ("series", tuple(series)),
+    ))
+
+    skills = _field(data, "skills", dict, "content")
+    certifications = [
+        components.cards([(_field(item, "title", str, f"certifications[{i}]"),
+                           _field(item, "text", str, f"certifications[{i}]"))],
+                         style="text-align: center;")
+        for i, item in enumerate(_items(data, "certifications", dict, "content"))
+    ]
+
+    projects = tuple(
+        _compile_project(project, f"projects[{i}]")
+        for i, project in enumerate(_items(data, "projects", dict, "content"))
+    )
+
+    return Content(
+        version=version,
+        header_html=header_html,
+        about_html=about_html,
+        summary=Summary(
+            career_start=min(starts) if starts else datetime.date.today(),
+            project_count=len(projects),
+            language_count=len(levels),
+            postgraduate_count=postgraduate_count,
+        ),
+        education_html=_halves(education),
+        language_bars_html=components.skill_bars(levels),
+        languages_card_html=components.languages_card(proficiency),
+        timeline=tuple(timeline),
+        achievements_html=_halves(achievements),
+        skills_evolution=skills_evolution,
+        technical_skills=_compile_skill_groups(skills, "technical"),
+        business_skills=_compile_skill_groups(skills, "business"),
+        certifications_html=tuple(certifications),
+        technologies_html=components.tags(
+            _items(data, "technologies", str, "content"),
+            css_class="card", style="text-align: center; padding: 1.5rem;",
+        ),
+        projects=projects,
+    )
+
+
+def load(path=CONTENT_PATH):
+    """Read, validate and compile a content file."""
+    raw = Path(path).read_bytes()
+    try:
+        data = json.loads(raw)
+    except ValueError as e:
+        raise ContentError(f"{path}: {e}") from None
+    return compile_content(data, version=hashlib.sha256(raw).hexdigest()[:12])
+
+
+# -- hot reload ---------------------------------------------------------------
+
+_reloader = hotreload.HotReloader(load, ContentError, "content")
+
+
+def get_content(path=CONTENT_PATH):
+    """Return the compiled content, recompiling it if the file changed."""
+    return _reloader.get(path)
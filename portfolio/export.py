@@ -0,0 +1,294 @@
+"""Static export of the portfolio.
+
+Renders every page of ``streamlit_app.py`` headlessly (through Streamlit's
+``AppTest``) and converts the emitted elements to plain HTML files that can be
+served by any static web server or CDN:
+
+- markdown and HTML blocks are rendered to HTML;
+- Plotly charts are embedded as their JSON spec and drawn with a local copy
+  of plotly.js;
+- images are written as the same optimized variants the app sends, under
+  content-hashed names so they can be cached forever;
+- the sidebar radio becomes a list of links between the pages;
+- the contact form posts to a dynamic endpoint (``--contact-endpoint``), for
+  instance a small service queuing the message with ``contact.Outbox``;
+  without one it opens the visitor's mail client, addressed to
+  ``contact.RECIPIENT``.
+
+Usage::
+
+    python -m portfolio.export site/ --contact-endpoint https://example.com/contact
+"""
+import argparse
+import hashlib
+import html
+import itertools
+import logging
+import shutil
+import sys
+from pathlib import Path
+
+from markdown_it import MarkdownIt
+
+from portfolio import theme
+from portfolio.contact import RECIPIENT
+from portfolio.pages import PAGES
+
+APP_DIR = Path(__file__).resolve().parent.parent
+APP_SCRIPT = APP_DIR / "streamlit_app.py"
+
+# Layout normally provided by the Streamlit frontend
+LAYOUT_CSS = """
+body{margin:0;font-family:'Inter','Segoe UI',Helvetica,sans-serif;background:#F8FAFC;color:#1E293B}
+.app{display:flex;min-height:100vh}
+section[data-testid="stSidebar"]{width:18rem;flex-shrink:0;padding:2rem 1.25rem;box-sizing:border-box}
+.main{flex:1;min-width:0;padding:2rem 3rem}
+.row{display:flex;gap:1rem}
+.column{min-width:0}
+.nav a{display:block;color:#fff;padding:.35rem .6rem;margin-bottom:.2rem;border-radius:.5rem;text-decoration:none}
+.nav a.active{background:rgba(255,255,255,.15);font-weight:600}
+figure{margin:0 0 1rem}
+figure img{max-width:100%;height:auto;display:block;margin:0 auto}
+figcaption{font-size:.85rem;color:#64748B;text-align:center;margin-top:.35rem}
+form.contact{border:1px solid #E2E8F0;border-radius:.75rem;padding:1.25rem;margin-bottom:1rem}
+form.contact label{display:block;font-size:.9rem;margin-bottom:.75rem}
+form.contact input,form.contact textarea{width:100%;box-sizing:border-box;margin-top:.25rem;padding:.5rem;border:1px solid #CBD5E1;border-radius:.5rem;font:inherit}
+form.contact button{padding:.5rem 1rem;border:1px solid #CBD5E1;border-radius:.5rem;background:#fff;font:inherit;cursor:pointer}
+@media (max-width:768px){.app,.row{flex-direction:column}section[data-testid="stSidebar"]{width:auto}.main{padding:1.5rem}}
+"""
+
+PLOT_SCRIPT = """
+document.querySelectorAll("script.plotly-spec").forEach(function (spec) {
+  var fig = JSON.parse(spec.textContent);
+  Plotly.newPlot(spec.dataset.target, fig.data, fig.layout, {responsive: true, displaylogo: false});
+});
+"""
+
+_markdown = MarkdownIt("commonmark", {"html": True})
+
+
+def page_filename(page):
+    """The first page is the site's index."""
+    return "index.html" if page == next(iter(PAGES)) else f"{page.lower()}.html"
+
+
+class MediaCapture:
+    """Collect the bytes of the media files (images) added during a run."""
+
+    def __init__(self):
+        from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+
+        self.files = {}
+        self._storage = MemoryMediaFileStorage
+        self._original = MemoryMediaFileStorage.load_and_get_id
+
+    def __enter__(self):
+        original = self._original
+
+        def load_and_get_id(storage, path_or_data, *args, **kwargs):
+            file_id = original(storage, path_or_data, *args, **kwargs)
+            data = path_or_data
+            if not isinstance(data, bytes):
+                data = Path(path_or_data).read_bytes()
+            self.files[file_id] = data
+            return file_id
+
+        self._storage.load_and_get_id = load_and_get_id
+        return self
+
+    def __exit__(self, *exc):
+        self._storage.load_and_get_id = self._original
+
+    @property
+    def total(self):
+        """Bytes of the media files collected."""
+        return sum(len(data) for data in self.files.values())
+
+
+class SiteWriter:
+    """Writes content-addressed static files next to the exported pages."""
+
+    def __init__(self, out_dir):
+        self.out_dir = Path(out_dir)
+        self.asset_dir = self.out_dir / "assets"
+        self.asset_dir.mkdir(parents=True, exist_ok=True)
+
+    def asset(self, data, suffix):
+        """Write ``data`` under its content hash and return its URL."""
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        name = f"{hashlib.sha256(data).hexdigest()[:16]}{suffix}"
+        path = self.asset_dir / name
+        if not path.exists():
+            path.write_bytes(data)
+        return f"assets/{name}"
+
+    def page(self, page, body):
+        (self.out_dir / page_filename(page)).write_text(body, encoding="utf-8")
+
+
+class PageRenderer:
+    """Converts the element tree of one ``AppTest`` run to HTML."""
+
+    def __init__(self, site, media, page, contact_endpoint):
+        self.site = site
+        self.media = media
+        self.page = page
+        self.contact_endpoint = contact_endpoint
+        self.stylesheet = theme.stylesheet()
+        self.stylesheets = [site.asset(LAYOUT_CSS, ".css")]
+        self.charts = itertools.count()
+        self.has_charts = False
+
+    def children(self, node):
+        return "".join(self.element(child) for child in node.children.values())
+
+    def element(self, node):
+        kind = node.type
+        proto = getattr(node, "proto", None)
+        if kind == "markdown":
+            return self.markdown(proto.body)
+        if kind == "horizontal":
+            return f'<div class="row">{self.children(node)}</div>'
+        if kind == "column":
+            return f'<div class="column" style="flex:{proto.weight}">{self.children(node)}</div>'
+        if kind == "form":
+            if self.contact_endpoint:
+                action = f'method="post" action="{html.escape(self.contact_endpoint)}"'
+            else:
+                action = f'method="post" action="mailto:{html.escape(RECIPIENT)}" enctype="text/plain"'
+            return f'<form class="contact" {action}>{self.children(node)}</form>'
+        if kind in ("text_input", "text_area"):
+            return self.field(kind, proto)
+        if kind == "button":
+            return f'<button type="submit">{html.escape(proto.label)}</button>'
+        if kind == "imgs":
+            return self.images(proto)
+        if kind == "plotly_chart":
+            return self.chart(proto)
+        if kind == "radio":
+            return self.navigation(proto)
+        if hasattr(node, "children"):
+            return self.children(node)
+        # Anything else only appears after user interaction (alerts, ...)
+        return ""
+
+    def markdown(self, body):
+        if body == self.stylesheet:
+            # Shared by every page: link it from <head> as a cacheable file
+            css = theme.minify(theme.STYLESHEET.read_text(encoding="utf-8"))
+            self.stylesheets.append(self.site.asset(css, ".css"))
+            return ""
+        return f'<div data-testid="stMarkdownContainer">{_markdown.render(body)}</div>'
+
+    def field(self, kind, proto):
+        name = proto.label.lower()
+        label = html.escape(proto.label)
+        if kind == "text_area":
+            control = f'<textarea name="{name}" rows="6" required></textarea>'
+        else:
+            input_type = "email" if name == "email" else "text"
+            control = f'<input type="{input_type}" name="{name}" required>'
+        return f"<label>{label}{control}</label>"
+
+    def images(self, proto):
+        parts = []
+        width = f' width="{proto.width}"' if proto.width > 0 else ""
+        for image in proto.imgs:
+            file_id = image.url.rsplit("/", 1)[-1].split(".")[0]
+            data = self.media.files.get(file_id)
+            if data is None:
+                continue
+            url = self.site.asset(data, Path(image.url).suffix)
+            alt = html.escape(image.caption)
+            caption = f"<figcaption>{alt}</figcaption>" if image.caption else ""
+            parts.append(f'<figure><img src="{url}" alt="{alt}"{width} loading="lazy">{caption}</figure>')
+        return "".join(parts)
+
+    def chart(self, proto):
+        self.has_charts = True
+        target = f"chart-{next(self.charts)}"
+        # "</" must not appear inside a <script> element
+        spec = proto.figure.spec.replace("</", "<\\/")
+        return (
+            f'<div class="chart" id="{target}"></div>'
+            f'<script type="application/json" class="plotly-spec" data-target="{target}">{spec}</script>'
+        )
+
+    def navigation(self, proto):
+        links = []
+        for option in proto.options:
+            active = ' class="active"' if option == self.page else ""
+            links.append(f'<a href="{page_filename(option)}"{active}>{html.escape(option)}</a>')
+        return f'<nav class="nav">{"".join(links)}</nav>'
+
+
+def render_page(at, site, media, page, contact_endpoint, plotly_js):
+    renderer = PageRenderer(site, media, page, contact_endpoint)
+    tree = at._tree
+    main = renderer.children(tree.children[0])
+    sidebar = renderer.children(tree.children[1])
+    scripts = ""
+    if renderer.has_charts:
+        scripts = f'<script src="{plotly_js}"></script><script>{PLOT_SCRIPT}</script>'
+    links = "".join(f'<link rel="stylesheet" href="{url}">' for url in renderer.stylesheets)
+    return (
+        "<!DOCTYPE html>\n"
+        '<html lang="en"><head><meta charset="utf-8">'
+        '<meta name="viewport" content="width=device-width, initial-scale=1">'
+        f"<title>{html.escape(page)} | Vinícius Paschoa | AI Portfolio</title>"
+        f"{links}</head>"
+        '<body><div class="app">'
+        f'<section data-testid="stSidebar">{sidebar}</section>'
+        f'<main class="main">{main}</main>'
+        f"</div>{scripts}</body></html>\n"
+    )
+
+
+def export(out_dir, contact_endpoint=None, timeout=60):
+    """Export every page to ``out_dir`` and return the written page files."""
+    from streamlit.testing.v1 import AppTest
+
+    site = SiteWriter(out_dir)
+    plotly_js = _copy_plotly_js(site)
+    written = []
+    with MediaCapture() as media:
+        at = AppTest.from_file(str(APP_SCRIPT), default_timeout=timeout).run()
+        for page in PAGES:
+            at.sidebar.radio[0].set_value(page).run()
+            if at.exception:
+                raise RuntimeError(f"{page}: {at.exception[0].message}")
+            site.page(page, render_page(at, site, media, page, contact_endpoint, plotly_js))
+            written.append(site.out_dir / page_filename(page))
+    return written
+
+
+def _copy_plotly_js(site):
+    # Ship plotly.js with the site so it works without outside network access
+    import plotly
+    import plotly.offline
+
+    source = Path(plotly.__file__).parent / "package_data" / "plotly.min.js"
+    target = site.asset_dir / f"plotly-{plotly.offline.get_plotlyjs_version()}.min.js"
+    if not target.exists():
+        shutil.copyfile(source, target)
+    return f"assets/{target.name}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export the portfolio as static HTML.")
+    parser.add_argument("out_dir", nargs="?", default="site", help="output directory (default: site)")
+    parser.add_argument("--contact-endpoint",
+                        help="URL the contact form posts to (default: a mailto: link)")
+    args = parser.parse_args(argv)
+
+    # AppTest does not add the app directory to sys.path like `streamlit run`
+    if str(APP_DIR) not in sys.path:
+        sys.path.insert(0, str(APP_DIR))
+    logging.disable(logging.WARNING)
+    for path in export(args.out_dir, args.contact_endpoint):
+        print(path)
+
+
+if __name__ == "__main__":
+    main()
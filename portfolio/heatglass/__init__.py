@@ -0,0 +1 @@
+"""HeatGlass: emotional temperature of recorded customer calls."""
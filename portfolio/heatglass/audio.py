@@ -0,0 +1,153 @@
+"""Streaming audio decoding.
+
+``open_audio`` returns the samples of a recording as a generator of
+fixed-size chunks of mono float32 samples in [-1, 1], so a call of any
+length is processed in constant memory and the first chunk is available as
+soon as its bytes are read.
+
+PCM WAV files are read with the standard library. Other formats (MP3, M4A,
+...) are decoded by an ``ffmpeg`` subprocess when one is installed, piping
+16 kHz mono samples back as they are decoded. A partial last frame of a
+truncated file is dropped, and a recording without any samples raises
+``AudioError`` once its chunks are read.
+"""
+import io
+import shutil
+import subprocess
+import threading
+import wave
+from typing import Iterator, NamedTuple, Optional
+
+import numpy as np
+
+CHUNK_SECONDS = 2.0
+# Sample rate requested from ffmpeg
+FFMPEG_RATE = 16000
+_PIPE_BYTES = 1 << 16
+
+
+class AudioError(ValueError):
+    """The file is not audio that can be decoded here."""
+
+
+class AudioStream(NamedTuple):
+    rate: int
+    duration: Optional[float]  # seconds, when the header gives it
+    chunks: Iterator[np.ndarray]
+
+
+def _pcm(raw, width, channels):
+    # Interleaved little-endian PCM -> mono float32, whole frames only
+    raw = raw[:len(raw) - len(raw) % (width * channels)]
+    if width == 1:
+        samples = (np.frombuffer(raw, dtype=np.uint8).astype(np.float32) - 128) / 128
+    elif width == 3:
+        triples = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3)
+        padded = np.zeros((len(triples), 4), dtype=np.uint8)
+        padded[:, 1:] = triples
+        samples = padded.view("<i4").ravel().astype(np.float32) / 2 ** 31
+    elif width in (2, 4):
+        samples = np.frombuffer(raw, dtype=f"<i{width}").astype(np.float32) / 2 ** (8 * width - 1)
+    else:
+        raise AudioError(f"unsupported sample width: {width} bytes")
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1)
+    return samples
+
+
+def _wav_chunks(wav, frames):
+    with wav:
+        width, channels = wav.getsampwidth(), wav.getnchannels()
+        decoded = 0
+        while raw := wav.readframes(frames):
+            samples = _pcm(raw, width, channels)
+            decoded += len(samples)
+            yield samples
+    if not decoded:
+        raise AudioError("the file has no audio")
+
+
+def _ffmpeg_chunks(ffmpeg, source, samples):
+    command = [ffmpeg, "-nostdin", "-v", "error", "-i", "pipe:0" if hasattr(source, "read") else str(source),
+               "-f", "s16le", "-ac", "1", "-ar", str(FFMPEG_RATE), "pipe:1"]
+    process = subprocess.Popen(
+        command, stdin=subprocess.PIPE if hasattr(source, "read") else subprocess.DEVNULL,
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+    )
+    if hasattr(source, "read"):
+        # Feed the input from a thread, so neither pipe fills up and blocks
+        def feed():
+            try:
+                while data := source.read(_PIPE_BYTES):
+                    process.stdin.write(data)
+            except (BrokenPipeError, ValueError):
+                pass
+            finally:
+                process.stdin.close()
+
+        threading.Thread(target=feed, daemon=True).start()
+    try:
+        decoded = 0
+        while raw := process.stdout.read(2 * samples):
+            chunk = _pcm(raw, 2, 1)
+            decoded += len(chunk)
+            yield chunk
+        if process.wait() != 0:
+            raise AudioError(process.stderr.read().decode("utf-8", "replace").strip() or "ffmpeg failed")
+        if not decoded:
+            raise AudioError("the file has no audio")
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+
+
+def open_audio(source, chunk_seconds=CHUNK_SECONDS):
+    """Open a recording (a path or a seekable file object) for streaming."""
+    if hasattr(source, "read"):
+        source.seek(0)
+        header = source.read(12)
+        source.seek(0)
+    else:
+        with open(source, "rb") as file:
+            header = file.read(12)
+    if header[:4] == b"RIFF" and header[8:12] == b"WAVE":
+        try:
+            wav = wave.open(source, "rb")
+        except (wave.Error, EOFError) as e:
+            raise AudioError(f"unsupported WAV file: {str(e) or 'truncated header'}") from None
+        rate = wav.getframerate()
+        return AudioStream(rate, wav.getnframes() / rate, _wav_chunks(wav, max(1, int(rate * chunk_seconds))))
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise AudioError("only PCM WAV files can be decoded without ffmpeg")
+    return AudioStream(FFMPEG_RATE, None, _ffmpeg_chunks(ffmpeg, source, int(FFMPEG_RATE * chunk_seconds)))
+
+
+def read_segments(stream, spans):
+    """Collect the samples of each ``(start, end)`` span, in seconds, in one
+    pass over the stream; only the spans are kept in memory."""
+    bounds = [(int(start * stream.rate), int(end * stream.rate)) for start, end in spans]
+    parts = [[] for _ in bounds]
+    position = 0
+    for chunk in stream.chunks:
+        end_of_chunk = position + len(chunk)
+        for (start, end), collected in zip(bounds, parts):
+            if start < end_of_chunk and end > position:
+                collected.append(chunk[max(start - position, 0):end - position])
+        position = end_of_chunk
+        if all(end <= position for _, end in bounds):
+            break
+    stream.chunks.close()
+    return [np.concatenate(collected) if collected else np.empty(0, dtype=np.float32) for collected in parts]
+
+
+def wav_bytes(samples, rate):
+    """Encode mono float samples as a 16-bit PCM WAV file."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes((np.clip(samples, -1, 1) * 32767).astype("<i2").tobytes())
+    return buffer.getvalue()
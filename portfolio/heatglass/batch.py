@@ -0,0 +1,141 @@
+"""Batch scoring of recorded calls: a day's calls from a folder or zip archive.
+
+Each call goes through three stages, chained as generators so they overlap
+chunk by chunk instead of running one after the other on the whole call:
+
+1. ``decode``: the audio as a stream of chunks (for compressed formats the
+   ffmpeg subprocess decodes ahead while the worker computes features);
+2. ``extract``: the prosodic features and temperature of each chunk, folded
+   into the call summary;
+3. ``score``: the prosody checks, applied to the summary (the phrase
+   checklist of ``checklist.py`` needs a transcript and is not run here).
+
+Calls are spread over a pool of worker processes (see ``portfolio.workers``)
+and results stream back per call in completion order. Results are cached
+under the SHA-256 of the audio, so re-running a day's batch only analyzes the
+calls that were added.
+
+From the command line::
+
+    python -m portfolio.heatglass.batch calls/2024-06-03/ [--workers 4] [--json]
+"""
+import argparse
+import io
+import json
+import shutil
+import sys
+
+from portfolio import workers
+from portfolio.heatglass import audio, prosody
+
+# Bump when the analysis changes, so cached results are recomputed
+NAMESPACE = "heatglass-batch-v1"
+AUDIO_SUFFIXES = (".wav", ".mp3", ".m4a", ".ogg", ".flac", ".webm")
+# Calls are larger than photos
+MAX_FILE_BYTES = 200 << 20
+
+# Objective checks on the call summary: (key, description, passes)
+PROSODY_CHECKS = (
+    ("no_critical_peak", "Temperature never reached critical",
+     lambda s: s.peak < prosody.THRESHOLDS[1]),
+    ("short_critical", "No critical stretch longer than 30 s",
+     lambda s: all(end - start <= 30 for start, end, _ in s.critical)),
+    ("low_critical_share", "Under 10% of the speech is critical",
+     lambda s: s.seconds["critical"] < prosody.CRITICAL_SHARE * max(s.speech, 1e-9)),
+    ("calm_on_average", "Average temperature is calm",
+     lambda s: s.mean_temperature < prosody.THRESHOLDS[0]),
+    ("few_silences", "Silence under 40% of the call",
+     lambda s: s.speech >= 0.6 * s.duration),
+)
+
+
+def decode(data):
+    return audio.open_audio(io.BytesIO(data))
+
+
+def extract(stream):
+    analyzer = prosody.ProsodyAnalyzer(stream.rate)
+    for chunk in stream.chunks:
+        analyzer.feed(chunk)
+    return analyzer.summary()
+
+
+def score(summary):
+    checks = {key: bool(passes(summary)) for key, _, passes in PROSODY_CHECKS}
+    return {
+        "duration": round(summary.duration, 1),
+        "speech": round(summary.speech, 1),
+        "level": summary.level,
+        "peak": round(summary.peak, 3),
+        "peak_time": summary.peak_time,
+        "mean_temperature": round(summary.mean_temperature, 3),
+        "critical_share": round(summary.seconds["critical"] / max(summary.speech, 1e-9), 3),
+        "critical": [[round(start, 1), round(end, 1), round(peak, 3)] for start, end, peak in summary.critical],
+        "checks": checks,
+        "score": round(100 * sum(checks.values()) / len(checks)),
+    }
+
+
+def analyze_call(data):
+    """Decode, analyze and score one call; runs in a worker process.
+
+    Any failure of the call is returned as its ``"error"``, so one damaged
+    file does not stop the batch.
+    """
+    try:
+        return score(extract(decode(data)))
+    except audio.AudioError as e:
+        return {"error": str(e)}
+    except Exception as e:
+        return {"error": f"cannot decode: {str(e) or type(e).__name__}"}
+
+
+def _suffixes():
+    return AUDIO_SUFFIXES if shutil.which("ffmpeg") else (".wav",)
+
+
+def iter_files(source):
+    """Yield ``(name, bytes)`` for the calls of a directory or zip archive.
+
+    Without ffmpeg only WAV files are read.
+    """
+    return workers.iter_files(source, _suffixes(), max_file_bytes=MAX_FILE_BYTES)
+
+
+def count_files(source):
+    return workers.count_files(source, _suffixes(), max_file_bytes=MAX_FILE_BYTES)
+
+
+make_pool = workers.make_pool
+
+
+def run_batch(files, pool, cache=None, max_in_flight=workers.MAX_IN_FLIGHT):
+    """Score ``(name, bytes)`` pairs; yield ``(name, digest, result, cached)``
+    in completion order."""
+    return workers.run_batch(analyze_call, files, pool, cache, max_in_flight)
+
+
+def default_cache():
+    return workers.default_cache(NAMESPACE)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score every call of a folder or zip archive.")
+    parser.add_argument("source", help="directory or .zip file")
+    parser.add_argument("--workers", type=int, default=workers.DEFAULT_WORKERS)
+    parser.add_argument("--json", action="store_true", help="print one JSON object per call")
+    args = parser.parse_args(argv)
+
+    with make_pool(args.workers) as pool:
+        for name, key, result, cached in run_batch(iter_files(args.source), pool, default_cache()):
+            if args.json:
+                print(json.dumps({"name": name, "sha256": key, "cached": cached, **result}))
+            elif "error" in result:
+                print(f"{name}: error: {result['error']}", file=sys.stderr)
+            else:
+                print(f"{name}: {result['level']}  score {result['score']}  peak {result['peak']:.2f}  "
+                      f"critical {result['critical_share']:.0%}{'  (cached)' if cached else ''}")
+
+
+if __name__ == "__main__":
+    main()
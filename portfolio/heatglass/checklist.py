@@ -0,0 +1,239 @@
+"""Objective checklist scoring of call transcripts.
+
+A checklist (``checklist.json`` next to this module, or ``PORTFOLIO_CHECKLIST``)
+is a list of rules, each with phrases that the agent must say (``required``,
+optionally ``within`` a number of seconds from the start) or must not say
+(``forbidden``), and a weight. The score is the weighted share of rules that
+pass.
+
+All phrases of all rules are compiled into one Aho-Corasick automaton over
+words: a transcript is scanned once, word by word, and every phrase occurrence
+is found in the same pass, so the cost is linear in the length of the
+transcript whatever the number of rules and phrases. Words are compared
+case- and accent-insensitively.
+
+``ChecklistScorer`` keeps the automaton state between segments: segments are
+fed as they are transcribed, a phrase split across two segments still
+matches, and nothing is rescanned. A transcript fed without segment times
+(pasted text) cannot tell when a phrase was said: its ``within`` rules are
+reported as not applicable and left out of the score.
+
+A compiled checklist carries the hash of its file as ``version``. Compiled
+checklists are cached by version, and ``get_checklist`` reloads the file when
+it changes, like the page content (see ``portfolio.hotreload``).
+"""
+import hashlib
+import json
+import os
+import re
+import unicodedata
+from collections import OrderedDict, deque
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from portfolio import hotreload
+
+CHECKLIST_PATH = Path(os.environ.get("PORTFOLIO_CHECKLIST", Path(__file__).with_name("checklist.json")))
+KINDS = ("required", "forbidden")
+# Compiled checklists kept in memory, by version
+CACHED_VERSIONS = 8
+
+_WORD = re.compile(r"\w+")
+
+
+class ChecklistError(ValueError):
+    """The checklist file is missing a field or has a value of the wrong type."""
+
+
+class Rule(NamedTuple):
+    key: str
+    description: str
+    kind: str
+    weight: float
+    within: Optional[float]  # seconds from the start of the call, for required rules
+
+
+class RuleResult(NamedTuple):
+    rule: Rule
+    passed: Optional[bool]       # None: not applicable (a timed rule, untimed transcript)
+    matches: int                 # words at which one of its phrases ends
+    first: Optional[float]       # time of the first occurrence, seconds
+
+
+class ChecklistResult(NamedTuple):
+    version: str
+    score: float  # 0 to 100
+    rules: list   # RuleResult per rule, in checklist order
+
+
+def words(text):
+    """Lowercase words of ``text`` without accents."""
+    folded = unicodedata.normalize("NFKD", text.casefold())
+    return _WORD.findall("".join(c for c in folded if not unicodedata.combining(c)))
+
+
+class Automaton:
+    """Aho-Corasick automaton over words.
+
+    ``add`` phrases, then ``step`` from state 0 through the words of a text;
+    ``outputs[state]`` holds the values of the phrases ending at the word.
+    """
+
+    def __init__(self):
+        self.vocabulary = {}
+        self._goto = [{}]
+        self._fail = [0]
+        self.outputs = [()]
+
+    def add(self, phrase, value):
+        state = 0
+        for word in words(phrase):
+            token = self.vocabulary.setdefault(word, len(self.vocabulary))
+            following = self._goto[state].get(token)
+            if following is None:
+                following = self._goto[state][token] = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self.outputs.append(())
+            state = following
+        if state and value not in self.outputs[state]:
+            self.outputs[state] += (value,)
+
+    def finish(self):
+        """Compute the failure links; call once after adding every phrase."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, following in self._goto[state].items():
+                queue.append(following)
+                fallback = self._fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[following] = self._goto[fallback].get(token, 0)
+                # A match ending here also ends every shorter phrase it contains
+                inherited = self.outputs[self._fail[following]]
+                self.outputs[following] += tuple(v for v in inherited if v not in self.outputs[following])
+        return self
+
+    def step(self, state, word):
+        token = self.vocabulary.get(word)
+        if token is None:
+            return 0
+        while state and token not in self._goto[state]:
+            state = self._fail[state]
+        return self._goto[state].get(token, 0)
+
+
+class Checklist(NamedTuple):
+    version: str
+    rules: tuple
+    automaton: Automaton
+
+    def scorer(self):
+        return ChecklistScorer(self)
+
+
+class ChecklistScorer:
+    """Score a transcript incrementally, one segment at a time."""
+
+    def __init__(self, checklist):
+        self.checklist = checklist
+        self._state = 0
+        self._matches = [0] * len(checklist.rules)
+        self._first = [None] * len(checklist.rules)
+        self._timed = False
+
+    def feed(self, text, time=None):
+        """Scan the next segment of the transcript, which starts at ``time``
+        seconds (None if unknown)."""
+        automaton = self.checklist.automaton
+        self._timed = self._timed or time is not None
+        state = self._state
+        for word in words(text):
+            state = automaton.step(state, word)
+            for index in automaton.outputs[state]:
+                self._matches[index] += 1
+                if self._first[index] is None:
+                    self._first[index] = time
+        self._state = state
+        return self
+
+    def result(self):
+        """Score of the transcript so far."""
+        results = []
+        for rule, matches, first in zip(self.checklist.rules, self._matches, self._first):
+            if rule.kind == "forbidden":
+                passed = not matches
+            elif rule.within is not None and not self._timed:
+                passed = None
+            else:
+                passed = bool(matches) and (rule.within is None or first <= rule.within)
+            results.append(RuleResult(rule, passed, matches, first))
+        total = sum(result.rule.weight for result in results if result.passed is not None)
+        earned = sum(result.rule.weight for result in results if result.passed)
+        return ChecklistResult(self.checklist.version, 100 * earned / total if total else 100.0, results)
+
+
+def _field(data, name, kind, where, optional=False, default=None):
+    return hotreload.field(data, name, kind, where, ChecklistError, optional, default)
+
+
+def compile_checklist(data, version):
+    if not isinstance(data, dict):
+        raise ChecklistError("checklist must be an object")
+    rules = []
+    automaton = Automaton()
+    for i, item in enumerate(_field(data, "rules", list, "checklist")):
+        where = f"rules[{i}]"
+        if not isinstance(item, dict):
+            raise ChecklistError(f"{where} must be an object")
+        kind = _field(item, "kind", str, where)
+        if kind not in KINDS:
+            raise ChecklistError(f"{where}.kind must be one of {', '.join(KINDS)}")
+        phrases = _field(item, "phrases", list, where)
+        if not phrases or not all(isinstance(phrase, str) and words(phrase) for phrase in phrases):
+            raise ChecklistError(f"{where}.phrases must be a list of non-empty strings")
+        within = _field(item, "within", (int, float, type(None)), where, optional=True)
+        rules.append(Rule(
+            key=_field(item, "key", str, where),
+            description=_field(item, "description", str, where),
+            kind=kind,
+            weight=float(_field(item, "weight", (int, float), where, optional=True, default=1)),
+            within=None if within is None else float(within),
+        ))
+        for phrase in phrases:
+            automaton.add(phrase, i)
+    return Checklist(version, tuple(rules), automaton.finish())
+
+
+_compiled = OrderedDict()
+
+
+def load(path=CHECKLIST_PATH):
+    """Read, validate and compile a checklist file, reusing the compiled
+    checklist of an identical file."""
+    raw = Path(path).read_bytes()
+    version = hashlib.sha256(raw).hexdigest()[:12]
+    checklist = _compiled.get(version)
+    if checklist is not None:
+        _compiled.move_to_end(version)
+    else:
+        try:
+            data = json.loads(raw)
+        except ValueError as e:
+            raise ChecklistError(f"{path}: {e}") from None
+        checklist = compile_checklist(data, version)
+        _compiled[version] = checklist
+        while len(_compiled) > CACHED_VERSIONS:
+            _compiled.popitem(last=False)
+    return checklist
+
+
+# -- hot reload ---------------------------------------------------------------
+
+_reloader = hotreload.HotReloader(load, ChecklistError, "checklist")
+
+
+def get_checklist(path=CHECKLIST_PATH):
+    """Return the compiled checklist, recompiling it if the file changed."""
+    return _reloader.get(path)
@@ -0,0 +1,237 @@
+"""Live HeatGlass demo shown under the project card."""
+import io
+import shutil
+import time
+import zipfile
+
+import streamlit as st
+
+from portfolio.heatglass import audio, batch, checklist, llm, prosody, report
+
+UPLOAD_TYPES = ["wav"]
+FFMPEG_TYPES = ["mp3", "m4a", "ogg", "flac", "webm"]
+# Redraw the timeline at most this often (seconds) while analyzing
+CHART_REFRESH = 0.25
+TABLE_REFRESH = 0.25
+LEVEL_ICONS = {"calm": "🟢", "neutral": "🟡", "critical": "🔴"}
+# Checklist rule results; None is a timed rule on an untimed transcript
+PASSED_ICONS = {True: "✅", False: "❌", None: "➖ not applicable"}
+
+
+def _chart(slot, times, temperatures):
+    slot.line_chart(
+        {"time (s)": times, "temperature": temperatures},
+        x="time (s)", y="temperature", height=260,
+    )
+
+
+def _analyze(upload, chart):
+    """Stream the upload through the analyzer, redrawing the timeline as
+    windows arrive; return the timeline and the summary."""
+    stream = audio.open_audio(upload)
+    analyzer = prosody.ProsodyAnalyzer(stream.rate)
+    progress = st.progress(0.0, text="Analyzing...")
+    times, temperatures = [], []
+    drawn = 0.0
+    start = time.perf_counter()
+    for chunk in stream.chunks:
+        features = analyzer.feed(chunk)
+        times.extend(features.time.round(2).tolist())
+        temperatures.extend(features.temperature.round(3).tolist())
+        if times and time.perf_counter() - drawn > CHART_REFRESH:
+            _chart(chart, times, temperatures)
+            if stream.duration:
+                progress.progress(min(1.0, times[-1] / stream.duration), text=f"Analyzed {report.clock(times[-1])}")
+            drawn = time.perf_counter()
+    progress.empty()
+    return times, temperatures, analyzer.summary(), time.perf_counter() - start
+
+
+def _summary(summary, elapsed):
+    icon = LEVEL_ICONS[summary.level]
+    columns = st.columns(3)
+    columns[0].metric("Call temperature", f"{icon} {summary.level}")
+    columns[1].metric("Peak", f"{summary.peak:.2f}", f"at {report.clock(summary.peak_time)}", delta_color="off")
+    columns[2].metric("Critical speech", f"{summary.seconds['critical'] / max(summary.speech, 1e-9):.0%}")
+    if summary.critical:
+        st.markdown("🔴 **Critical moments:** " + ", ".join(
+            f"{report.clock(start)}–{report.clock(end)} (peak {peak:.2f})" for start, end, peak in summary.critical
+        ))
+    st.caption(
+        f"{report.clock(summary.duration)} of audio analyzed in {elapsed:.2f} s — "
+        f"temperature from RMS energy, pitch and zero-crossing rate against the speaker's baseline"
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def get_pool():
+    """Worker processes for batch scoring, started on first use and shared."""
+    return batch.make_pool()
+
+
+@st.cache_resource(show_spinner=False)
+def get_result_cache():
+    return batch.default_cache()
+
+
+@st.cache_resource(show_spinner=False)
+def get_llm_client():
+    """Language-model client with its answer cache, shared by all sessions."""
+    return llm.default_client()
+
+
+def _report(upload, summary):
+    state_key = f"heatglass_report_{upload.file_id}"
+    if state_key not in st.session_state:
+        if not st.button("Write the strategic summary", key="heatglass_report_run"):
+            return
+        client = get_llm_client()
+        start = time.perf_counter()
+        try:
+            with st.spinner("Transcribing the sensitive segments..."):
+                result = report.build_report(lambda: audio.open_audio(upload), summary, client)
+        except llm.LLMError as e:
+            st.error(f"The language model could not be reached: {e}")
+            return
+        st.session_state[state_key] = (result, time.perf_counter() - start)
+    result, elapsed = st.session_state[state_key]
+    stats = result.usage
+    if not result.segments:
+        st.info("No speech to summarize.")
+        return
+    st.markdown(result.summary)
+    st.dataframe(
+        [{"segment": f"{report.clock(segment.start)}–{report.clock(segment.end)}",
+          "temperature": f"{LEVEL_ICONS[segment.level]} {segment.level}",
+          "transcript": segment.transcript} for segment in result.segments],
+        use_container_width=True, hide_index=True,
+    )
+    st.caption(
+        f"{stats['calls']} model calls, {stats['cached']} answered from cache, "
+        f"{stats['deduplicated']} deduplicated — {elapsed:.1f} s with {get_llm_client().provider.name}"
+    )
+
+
+def _checklist_table(slot, result):
+    with slot.container():
+        st.metric("Checklist score", f"{result.score:.0f} / 100")
+        st.dataframe(
+            [{"": PASSED_ICONS[item.passed], "check": item.rule.description, "matches": item.matches,
+              "first at": "" if item.first is None else report.clock(item.first)} for item in result.rules],
+            use_container_width=True, hide_index=True,
+        )
+
+
+def _checklist(upload):
+    rules = checklist.get_checklist()
+    slot = st.empty()
+    pasted = st.text_area("Or paste a transcript to score, one segment per line", key="heatglass_transcript")
+    if pasted.strip():
+        scorer = rules.scorer()
+        for line in pasted.splitlines():
+            scorer.feed(line)
+        _checklist_table(slot, scorer.result())
+        return
+    state_key = f"heatglass_checklist_{upload.file_id}_{rules.version}"
+    if state_key not in st.session_state:
+        if not slot.button("Transcribe the call and score the checklist", key="heatglass_checklist_run"):
+            return
+        scorer = rules.scorer()
+        try:
+            # The score is updated as each batch of segments is transcribed
+            for start, _, text in report.transcribe_call(audio.open_audio(upload), get_llm_client()):
+                _checklist_table(slot, scorer.feed(text, start).result())
+        except llm.LLMError as e:
+            st.error(f"The language model could not be reached: {e}")
+            return
+        st.session_state[state_key] = scorer.result()
+    _checklist_table(slot, st.session_state[state_key])
+    st.caption(f"Checklist version {rules.version}")
+
+
+def _single():
+    types = UPLOAD_TYPES + (FFMPEG_TYPES if shutil.which("ffmpeg") else [])
+    upload = st.file_uploader(
+        "Upload a recorded call to chart its emotional temperature", type=types, key="heatglass_upload",
+    )
+    if upload is None:
+        return
+    state_key = f"heatglass_{upload.file_id}"
+    chart = st.empty()
+    if state_key not in st.session_state:
+        try:
+            st.session_state[state_key] = _analyze(upload, chart)
+        except (ValueError, EOFError) as e:  # AudioError, or the decoder failing on a damaged file
+            st.error(f"This file cannot be analyzed: {e}")
+            return
+    times, temperatures, summary, elapsed = st.session_state[state_key]
+    if not times:
+        st.warning("The recording is too short to analyze.")
+        return
+    _chart(chart, times, temperatures)
+    _summary(summary, elapsed)
+    summary_tab, checklist_tab = st.tabs(["Strategic summary", "Checklist"])
+    with summary_tab:
+        _report(upload, summary)
+    with checklist_tab:
+        _checklist(upload)
+
+
+def _batch_row(name, result, cached):
+    if "error" in result:
+        return {"call": name, "status": "error: " + result["error"]}
+    return {
+        "call": name,
+        "status": "cached" if cached else "analyzed",
+        "duration": report.clock(result["duration"]),
+        "temperature": f"{LEVEL_ICONS[result['level']]} {result['level']}",
+        "prosody score": result["score"],
+        "peak": result["peak"],
+        "critical %": round(100 * result["critical_share"], 1),
+        "critical moments": ", ".join(
+            f"{report.clock(start)}–{report.clock(end)}" for start, end, _ in result["critical"]
+        ),
+    }
+
+
+def _batch():
+    upload = st.file_uploader("Upload a day's calls as a zip archive", type=["zip"], key="heatglass_batch_upload")
+    if upload is None:
+        return
+    state_key = f"heatglass_batch_{upload.file_id}"
+    table = st.empty()
+    if state_key not in st.session_state:
+        if not st.button("Score calls", key="heatglass_batch_run"):
+            return
+        archive = io.BytesIO(upload.getvalue())
+        try:
+            total = batch.count_files(archive)
+        except zipfile.BadZipFile:
+            st.error("This file is not a valid zip archive.")
+            return
+        rows = []
+        progress = st.progress(0.0)
+        refreshed = 0.0
+        start = time.perf_counter()
+        # Members are decompressed one at a time, as the pool takes them
+        for name, _, result, cached in batch.run_batch(batch.iter_files(archive), get_pool(), get_result_cache()):
+            rows.append(_batch_row(name, result, cached))
+            progress.progress(len(rows) / max(total, 1), text=f"{len(rows)} / {total} calls — last: {name}")
+            if time.perf_counter() - refreshed > TABLE_REFRESH:
+                table.dataframe(rows, use_container_width=True, hide_index=True)
+                refreshed = time.perf_counter()
+        progress.empty()
+        st.session_state[state_key] = (rows, time.perf_counter() - start)
+    rows, elapsed = st.session_state[state_key]
+    table.dataframe(rows, use_container_width=True, hide_index=True)
+    cached = sum(row["status"] == "cached" for row in rows)
+    st.caption(f"{len(rows)} calls ({cached} from cache) in {elapsed:.1f} s. Click a column header to sort.")
+
+
+def render():
+    mode = st.radio("Mode", ["Single call", "Call batch (zip)"], horizontal=True,
+                    key="heatglass_mode", label_visibility="collapsed")
+    if mode == "Single call":
+        _single()
+    else:
+        _batch()
@@ -0,0 +1,194 @@
+"""Language-model calls for HeatGlass: transcription and text completion.
+
+A provider is any object with a ``name`` (part of the cache key) and two
+blocking methods, ``transcribe(wav_bytes)`` and ``complete(prompt)``, both
+returning text. ``PORTFOLIO_LLM`` selects one:
+
+- ``stub`` (default) or ``stub:<latency seconds>``: offline and deterministic,
+  for development and tests;
+- ``openai`` or ``openai:<chat model>``: the OpenAI API (GPT-4 Turbo by
+  default, Whisper for transcription), with the key in ``OPENAI_API_KEY``.
+
+``LLMClient`` runs batches of requests concurrently, at most ``concurrency``
+at a time, each blocking call in a thread of the event loop. Every answer is
+cached under the hash of the provider, the request kind, the prompt and the
+payload (the audio segment or text), so re-analysing a call does not pay for
+the same segment twice; identical requests in flight at the same time share
+one call.
+"""
+import asyncio
+import hashlib
+import io
+import json
+import os
+import time
+import urllib.error
+import urllib.request
+import uuid
+import wave
+from collections import Counter
+from typing import NamedTuple
+
+NAMESPACE = "heatglass-llm-v1"
+DEFAULT_CONCURRENCY = 4
+HTTP_TIMEOUT = 120
+OPENAI_URL = "https://api.openai.com/v1"
+OPENAI_CHAT_MODEL = "gpt-4-turbo"
+OPENAI_TRANSCRIPTION_MODEL = "whisper-1"
+
+
+class LLMError(RuntimeError):
+    """A provider call failed."""
+
+
+class Request(NamedTuple):
+    kind: str       # "transcribe" or "complete"
+    prompt: str     # empty for transcriptions
+    payload: bytes  # WAV bytes for transcriptions, else empty
+
+    def key(self, provider):
+        digest = hashlib.sha256()
+        for part in (provider.name, self.kind, self.prompt):
+            digest.update(part.encode("utf-8") + b"\x00")
+        digest.update(self.payload)
+        return digest.hexdigest()
+
+
+def transcription(wav_bytes):
+    return Request("transcribe", "", wav_bytes)
+
+
+def completion(prompt):
+    return Request("complete", prompt, b"")
+
+
+class StubProvider:
+    """Offline provider: answers are derived from the request itself."""
+
+    def __init__(self, latency=0.0):
+        self.name = "stub"
+        self.latency = latency
+
+    def transcribe(self, wav_bytes):
+        time.sleep(self.latency)
+        with wave.open(io.BytesIO(wav_bytes), "rb") as wav:
+            seconds = wav.getnframes() / wav.getframerate()
+        return f"(stub transcript of {seconds:.1f} s of audio)"
+
+    def complete(self, prompt):
+        time.sleep(self.latency)
+        return f"(stub answer) {prompt.strip().splitlines()[-1][:300]}"
+
+
+class OpenAIProvider:
+    """GPT chat completions and Whisper transcriptions over HTTPS."""
+
+    def __init__(self, model=OPENAI_CHAT_MODEL, transcription_model=OPENAI_TRANSCRIPTION_MODEL,
+                 api_key=None, timeout=HTTP_TIMEOUT):
+        self.name = f"openai:{model}:{transcription_model}"
+        self.model = model
+        self.transcription_model = transcription_model
+        self.api_key = api_key or os.environ.get("OPENAI_API_KEY", "")
+        self.timeout = timeout
+
+    def _post(self, path, body, content_type):
+        request = urllib.request.Request(
+            f"{OPENAI_URL}/{path}", data=body, method="POST",
+            headers={"Content-Type": content_type, "Authorization": f"Bearer {self.api_key}"},
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return json.loads(response.read())
+        except (urllib.error.URLError, OSError, ValueError) as e:
+            raise LLMError(f"OpenAI request failed: {e}") from e
+
+    def complete(self, prompt):
+        body = json.dumps({
+            "model": self.model, "temperature": 0,
+            "messages": [{"role": "user", "content": prompt}],
+        }).encode("utf-8")
+        return self._post("chat/completions", body, "application/json")["choices"][0]["message"]["content"]
+
+    def transcribe(self, wav_bytes):
+        boundary = uuid.uuid4().hex
+        body = (
+            f"--{boundary}\r\nContent-Disposition: form-data; name=\"model\"\r\n\r\n{self.transcription_model}\r\n"
+            f"--{boundary}\r\nContent-Disposition: form-data; name=\"file\"; filename=\"segment.wav\"\r\n"
+            f"Content-Type: audio/wav\r\n\r\n"
+        ).encode("utf-8") + wav_bytes + f"\r\n--{boundary}--\r\n".encode("utf-8")
+        return self._post("audio/transcriptions", body, f"multipart/form-data; boundary={boundary}")["text"]
+
+
+def make_provider(spec=None):
+    """Build the provider described by ``spec`` (see the module docstring)."""
+    spec = spec or os.environ.get("PORTFOLIO_LLM") or "stub"
+    name, _, option = spec.partition(":")
+    if name == "openai":
+        return OpenAIProvider(option or OPENAI_CHAT_MODEL)
+    if name == "stub":
+        return StubProvider(float(option) if option else 0.0)
+    raise ValueError(f"unknown language model provider: {spec}")
+
+
+class LLMClient:
+    """Cached, concurrency-limited access to a provider."""
+
+    def __init__(self, provider, cache=None, concurrency=DEFAULT_CONCURRENCY):
+        self.provider = provider
+        self.cache = cache
+        self.concurrency = concurrency
+        # Calls, cache hits and deduplicated requests of all callers
+        self.stats = Counter()
+
+    def _call(self, request):
+        if request.kind == "transcribe":
+            return self.provider.transcribe(request.payload)
+        return self.provider.complete(request.prompt)
+
+    async def gather(self, requests, usage=None):
+        """Answer ``requests`` concurrently; return the answers in order.
+
+        The calls, cache hits and deduplicated requests of this batch alone
+        are added to the ``usage`` counter, if given.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        pending = {}
+        counts = Counter()
+
+        async def answer(request, key):
+            async with semaphore:
+                counts["calls"] += 1
+                text = await asyncio.to_thread(self._call, request)
+            if self.cache is not None:
+                self.cache.put(key, text)
+            return text
+
+        tasks = []
+        for request in requests:
+            key = request.key(self.provider)
+            cached = self.cache.get(key) if self.cache is not None else None
+            if cached is not None:
+                counts["cached"] += 1
+                tasks.append(asyncio.sleep(0, cached))
+            elif key in pending:
+                counts["deduplicated"] += 1
+                tasks.append(pending[key])
+            else:
+                pending[key] = asyncio.ensure_future(answer(request, key))
+                tasks.append(pending[key])
+        try:
+            return list(await asyncio.gather(*tasks))
+        finally:
+            self.stats.update(counts)
+            if usage is not None:
+                usage.update(counts)
+
+    def run(self, requests, usage=None):
+        """Blocking version of ``gather``, for code outside an event loop."""
+        return asyncio.run(self.gather(list(requests), usage))
+
+
+def default_client():
+    from portfolio import workers
+
+    return LLMClient(make_provider(), workers.default_cache(NAMESPACE))
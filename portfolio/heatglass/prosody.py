@@ -0,0 +1,216 @@
+"""Prosodic features and emotional temperature, computed incrementally.
+
+Samples are cut into ``FRAME``-second frames; every frame of a chunk is
+analyzed at once with array operations:
+
+- RMS energy, in dB relative to full scale;
+- zero-crossing rate, the share of consecutive samples changing sign;
+- a pitch proxy: the strongest autocorrelation peak between ``MIN_PITCH`` and
+  ``MAX_PITCH`` (autocorrelations from one batched FFT), for frames periodic
+  enough to be voiced.
+
+Frames are grouped into ``WINDOW``-second windows, the points of the
+timeline. A window's temperature measures how far its energy, pitch and
+zero-crossing rate rise above the speaker's baseline: running statistics of
+the call so far, starting from a prior for calm speech so that the first
+seconds have a reference. It goes from 0 (calm) to 1 (agitated) and is
+smoothed over neighbouring windows.
+
+``ProsodyAnalyzer`` keeps only the samples of the current incomplete window,
+the running baselines and the summary counters, so its memory does not grow
+with the length of the call.
+"""
+from typing import NamedTuple
+
+import numpy as np
+
+WINDOW = 0.5
+FRAME = 0.025
+MIN_PITCH = 60
+MAX_PITCH = 400
+# Normalized autocorrelation above which a frame counts as voiced
+VOICING = 0.3
+# Windows quieter than this are silence and keep the previous temperature
+SILENCE_DB = -45.0
+# Weight of a new window in the smoothed temperature
+SMOOTHING = 0.35
+
+LEVELS = ("calm", "neutral", "critical")
+# Temperatures from which a window is neutral, then critical
+THRESHOLDS = (0.35, 0.65)
+# Share of the speech that makes a whole call critical, or at least neutral
+CRITICAL_SHARE = 0.1
+NEUTRAL_SHARE = 0.3
+
+# Baseline priors: (mean, standard deviation) of calm speech, weighted as
+# this many windows of the call
+PRIOR_WINDOWS = 20
+ENERGY_PRIOR = (-28.0, 6.0)      # dBFS
+PITCH_PRIOR = (np.log2(160), 0.35)  # octaves
+ZCR_PRIOR = (0.08, 0.04)
+# Weights of the energy, pitch and zero-crossing z-scores
+WEIGHTS = np.array([0.5, 0.35, 0.15])
+
+
+class Features(NamedTuple):
+    time: np.ndarray         # window start, seconds
+    rms_db: np.ndarray
+    zcr: np.ndarray
+    pitch: np.ndarray        # Hz, NaN for unvoiced windows
+    temperature: np.ndarray  # 0 (calm) to 1 (critical), smoothed
+
+
+class CallSummary(NamedTuple):
+    duration: float          # seconds analyzed
+    speech: float            # seconds above the silence level
+    seconds: dict            # seconds of speech per level
+    peak: float              # highest temperature
+    peak_time: float         # when it was reached
+    mean_temperature: float  # over the speech
+    level: str               # level of the whole call
+    critical: list           # (start, end, peak) of each critical stretch
+
+
+def level(temperature):
+    """The level name of a temperature."""
+    return LEVELS[int(np.searchsorted(THRESHOLDS, temperature, side="right"))]
+
+
+def frame_features(frames, rate):
+    """RMS energy, zero-crossing rate and pitch (Hz, NaN if unvoiced) of
+    each row of ``frames``."""
+    size = frames.shape[1]
+    centered = frames - frames.mean(axis=1, keepdims=True)
+    rms = np.sqrt(np.mean(centered * centered, axis=1))
+    zcr = np.mean(np.signbit(frames[:, 1:]) != np.signbit(frames[:, :-1]), axis=1)
+
+    spectrum = np.fft.rfft(centered, 2 * size)
+    autocorrelation = np.fft.irfft(spectrum.real ** 2 + spectrum.imag ** 2)[:, :size]
+    low, high = int(rate / MAX_PITCH), min(size - 1, int(rate / MIN_PITCH))
+    lags = autocorrelation[:, low:high + 1]
+    best = np.argmax(lags, axis=1)
+    strength = lags[np.arange(len(lags)), best] / (autocorrelation[:, 0] + 1e-12)
+    pitch = rate / (best + low)
+    pitch = np.where(strength >= VOICING, pitch, np.nan)
+    return rms, zcr, pitch
+
+
+class _Baseline:
+    """Running mean and variance, starting from a weighted prior."""
+
+    def __init__(self, mean, std, weight=PRIOR_WINDOWS):
+        self.count = float(weight)
+        self.mean = float(mean)
+        self.m2 = std * std * weight
+
+    def z(self, values):
+        return (values - self.mean) / np.sqrt(self.m2 / self.count)
+
+    def update(self, values):
+        values = values[np.isfinite(values)]
+        if not len(values):
+            return
+        # Chan et al.'s update for merging a batch into the running moments
+        count, mean = len(values), float(values.mean())
+        delta = mean - self.mean
+        total = self.count + count
+        self.m2 += float(((values - mean) ** 2).sum()) + delta * delta * self.count * count / total
+        self.mean += delta * count / total
+        self.count = total
+
+
+class ProsodyAnalyzer:
+    """Turn chunks of samples into timeline windows, one call at a time."""
+
+    def __init__(self, rate, window=WINDOW):
+        self.rate = rate
+        self.frame = max(1, round(rate * FRAME))
+        self.frames_per_window = max(1, round(window / FRAME))
+        self.window = self.frame * self.frames_per_window
+        self._pending = np.empty(0, dtype=np.float32)
+        self._windows = 0
+        self._energy = _Baseline(*ENERGY_PRIOR)
+        self._pitch = _Baseline(*PITCH_PRIOR)
+        self._zcr = _Baseline(*ZCR_PRIOR)
+        self._temperature = 0.0
+        self._seconds = dict.fromkeys(LEVELS, 0.0)
+        self._temperature_sum = 0.0
+        self._peak = (0.0, 0.0)
+        self._critical = []
+        self._open = None  # [start, end, peak] of the current critical stretch
+
+    def feed(self, samples):
+        """Analyze the windows completed by ``samples``."""
+        data = np.concatenate([self._pending, np.asarray(samples, dtype=np.float32)])
+        count = len(data) // self.window
+        self._pending = data[count * self.window:].copy()
+        frames = data[:count * self.window].reshape(count * self.frames_per_window, self.frame)
+        rms, zcr, pitch = (
+            values.reshape(count, self.frames_per_window) for values in frame_features(frames, self.rate)
+        )
+
+        rms_db = 10 * np.log10(np.mean(rms * rms, axis=1) + 1e-12)
+        zcr = zcr.mean(axis=1)
+        voiced = np.isfinite(pitch)
+        voiced_count = voiced.sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            octaves = np.where(voiced, np.log2(np.where(voiced, pitch, 1)), 0).sum(axis=1) / voiced_count
+        speech = rms_db > SILENCE_DB
+
+        # Rise above the baseline of the call so far; only speech updates it
+        rises = np.stack([
+            self._energy.z(rms_db), np.nan_to_num(self._pitch.z(octaves)), self._zcr.z(zcr),
+        ], axis=1)
+        raw = 1 / (1 + np.exp(-2 * (np.clip(rises, -3, 3) @ WEIGHTS - 1)))
+        self._energy.update(rms_db[speech])
+        self._pitch.update(octaves[speech])
+        self._zcr.update(zcr[speech])
+
+        temperature = np.empty(count, dtype=np.float32)
+        times = (self._windows + np.arange(count)) * self.window / self.rate
+        seconds = self.window / self.rate
+        for i in range(count):
+            if speech[i]:
+                self._temperature += SMOOTHING * (raw[i] - self._temperature)
+                self._seconds[level(self._temperature)] += seconds
+                self._temperature_sum += self._temperature * seconds
+                if self._temperature > self._peak[0]:
+                    self._peak = (float(self._temperature), float(times[i]))
+                self._track_critical(float(times[i]), seconds)
+            temperature[i] = self._temperature
+        self._windows += count
+
+        with np.errstate(invalid="ignore"):
+            pitch_hz = np.exp2(octaves).astype(np.float32)
+        return Features(times, rms_db.astype(np.float32), zcr.astype(np.float32), pitch_hz, temperature)
+
+    def _track_critical(self, time, seconds):
+        if self._temperature >= THRESHOLDS[1]:
+            if self._open is None:
+                self._open = [time, time, 0.0]
+            self._open[1] = time + seconds
+            self._open[2] = max(self._open[2], float(self._temperature))
+        elif self._open is not None:
+            self._critical.append(tuple(self._open))
+            self._open = None
+
+    def summary(self):
+        """Summary of the call analyzed so far."""
+        speech = sum(self._seconds.values())
+        if speech and self._seconds["critical"] >= CRITICAL_SHARE * speech:
+            call_level = "critical"
+        elif speech and self._seconds["critical"] + self._seconds["neutral"] >= NEUTRAL_SHARE * speech:
+            call_level = "neutral"
+        else:
+            call_level = "calm"
+        return CallSummary(
+            duration=self._windows * self.window / self.rate,
+            speech=speech,
+            seconds=dict(self._seconds),
+            peak=self._peak[0],
+            peak_time=self._peak[1],
+            mean_temperature=self._temperature_sum / speech if speech else 0.0,
+            level=call_level,
+            critical=self._critical + ([tuple(self._open)] if self._open else []),
+        )
+
@@ -0,0 +1,127 @@
+"""Transcripts and strategic summary of a call.
+
+``transcribe_call`` transcribes a whole call in consecutive segments, a few
+at a time, yielding each segment's text in order as soon as it is ready.
+
+For the strategic summary, the critical stretches found by the prosody
+analysis (or the peak, for a call without any) are cut out of the audio with
+some context, transcribed and classified segment by segment, all segments
+concurrently, and the transcripts are summarized in one last request. Only
+these few segments are sent to the language model, never the whole call.
+"""
+import itertools
+from collections import Counter
+from typing import List, NamedTuple
+
+import numpy as np
+
+from portfolio.heatglass import audio, llm, prosody
+
+MAX_SEGMENTS = 5
+# Seconds of audio kept around each stretch, and the longest segment sent
+SEGMENT_CONTEXT = 3.0
+MAX_SEGMENT = 60.0
+# Length of the segments of a full transcript, seconds
+TRANSCRIPT_SEGMENT = 30.0
+
+CLASSIFY_PROMPT = (
+    "Classify the emotional temperature of this excerpt of a customer service call "
+    "as calm, neutral or critical. Answer with one word.\n\n{transcript}"
+)
+SUMMARY_PROMPT = (
+    "These are the most emotionally sensitive moments of one customer service call of a car glass "
+    "repair company. Write a short strategic summary for the quality team: what upset the customer, "
+    "how the agent handled it, and what should be done differently.\n\n{excerpts}"
+)
+
+
+class Segment(NamedTuple):
+    start: float
+    end: float
+    peak: float      # highest acoustic temperature in the segment
+    acoustic: str    # level from the prosody analysis
+    level: str       # level given by the language model, else the acoustic one
+    transcript: str
+
+
+class Report(NamedTuple):
+    segments: List[Segment]
+    summary: str
+    usage: Counter  # model calls, cache hits and deduplicated requests of this report
+
+
+def sensitive_spans(summary):
+    """The ``(start, end, peak)`` spans to transcribe, hottest first."""
+    spans = sorted(summary.critical, key=lambda span: -span[2])[:MAX_SEGMENTS]
+    if not spans and summary.speech:
+        spans = [(summary.peak_time, summary.peak_time, summary.peak)]
+    return [
+        (max(0.0, start - SEGMENT_CONTEXT), min(summary.duration, end + SEGMENT_CONTEXT, start + MAX_SEGMENT), peak)
+        for start, end, peak in spans
+    ]
+
+
+def _segments(stream, size):
+    # Re-cut the stream's chunks into ``(start, samples)`` of ``size`` samples
+    buffered, length, start = [], 0, 0
+    for chunk in stream.chunks:
+        buffered.append(chunk)
+        length += len(chunk)
+        while length >= size:
+            data = np.concatenate(buffered)
+            yield start, data[:size]
+            buffered, length, start = [data[size:]], length - size, start + size
+    if length:
+        yield start, np.concatenate(buffered)
+
+
+def transcribe_call(stream, client, segment_seconds=TRANSCRIPT_SEGMENT):
+    """Yield ``(start, end, text)`` for consecutive segments of the call.
+
+    ``client.concurrency`` segments are transcribed at a time, so at most
+    that many segments of audio are held in memory.
+    """
+    segments = _segments(stream, max(1, int(segment_seconds * stream.rate)))
+    while batch := list(itertools.islice(segments, client.concurrency)):
+        texts = client.run(llm.transcription(audio.wav_bytes(samples, stream.rate)) for _, samples in batch)
+        for (start, samples), text in zip(batch, texts):
+            yield start / stream.rate, (start + len(samples)) / stream.rate, text
+
+
+def _level(answer, default):
+    words = answer.lower().split()
+    return next((level for level in reversed(prosody.LEVELS) if level in words), default)
+
+
+def clock(seconds):
+    """``m:ss`` of a time in seconds."""
+    return f"{int(seconds) // 60}:{int(seconds) % 60:02d}"
+
+
+def build_report(open_stream, summary, client):
+    """Transcribe, classify and summarize the sensitive segments of a call.
+
+    ``open_stream`` returns a new ``AudioStream`` of the call; the audio is
+    read once more to cut the segments. The report's ``usage`` counts the
+    model calls of this report alone, even while other reports share the client.
+    """
+    spans = sensitive_spans(summary)
+    usage = Counter()
+    if not spans:
+        return Report([], "", usage)
+    stream = open_stream()
+    clips = audio.read_segments(stream, [(start, end) for start, end, _ in spans])
+    transcripts = client.run((llm.transcription(audio.wav_bytes(clip, stream.rate)) for clip in clips), usage)
+    answers = client.run((llm.completion(CLASSIFY_PROMPT.format(transcript=text)) for text in transcripts), usage)
+
+    segments = []
+    for (start, end, peak), transcript, answer in zip(spans, transcripts, answers):
+        acoustic = prosody.level(peak)
+        segments.append(Segment(start, end, peak, acoustic, _level(answer, acoustic), transcript))
+    segments.sort(key=lambda segment: segment.start)
+    excerpts = "\n\n".join(
+        f"[{clock(segment.start)}–{clock(segment.end)}, {segment.level}] {segment.transcript}"
+        for segment in segments
+    )
+    (text,) = client.run([llm.completion(SUMMARY_PROMPT.format(excerpts=excerpts))], usage)
+    return Report(segments, text, usage)
@@ -0,0 +1,71 @@
+"""Validated files that are reloaded when they change.
+
+``HotReloader`` wraps the ``load(path)`` function of a file format (the page
+content, the HeatGlass checklist). The file's mtime and size are checked on
+every ``get``, so an edit is picked up by the next call in every session
+without restarting the app. An edit that does not load is logged and the
+previous value stays in use.
+
+``field`` is the shared check of one value of a JSON object, raising the
+format's own error type.
+"""
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+def field(obj, key, kind, where, error=ValueError, optional=False, default=None):
+    """Return ``obj[key]``, checked to be of ``kind`` (a type or tuple of types).
+
+    A missing optional key gives ``default``. Booleans are not accepted as
+    numbers.
+    """
+    if not isinstance(obj, dict):
+        raise error(f"{where}: expected an object")
+    if key not in obj:
+        if optional:
+            return default
+        raise error(f"{where}: missing '{key}'")
+    value = obj[key]
+    kinds = kind if isinstance(kind, tuple) else (kind,)
+    if not isinstance(value, kinds) or isinstance(value, bool) and bool not in kinds:
+        expected = " or ".join("null" if k is type(None) else k.__name__ for k in kinds)
+        raise error(f"{where}.{key}: expected {expected}, got {type(value).__name__}")
+    return value
+
+
+class HotReloader:
+    """The value of ``load(path)``, reloaded when the file changes.
+
+    ``errors`` are the exceptions of an invalid file: they are raised by the
+    first load and logged afterwards.
+    """
+
+    def __init__(self, load, errors=(), what="file"):
+        self.load = load
+        self.errors = (OSError,) + tuple(errors if isinstance(errors, tuple) else (errors,))
+        self.what = what
+        self._lock = threading.Lock()
+        # (path, mtime_ns, size) of the file the value was loaded from, and the value
+        self._loaded = (None, None)
+
+    def get(self, path):
+        """Return the value of ``path``, reloading it if the file changed."""
+        stat = os.stat(path)
+        stamp = (str(path), stat.st_mtime_ns, stat.st_size)
+        loaded_stamp, value = self._loaded
+        if stamp == loaded_stamp:
+            return value
+        with self._lock:
+            loaded_stamp, value = self._loaded
+            if stamp != loaded_stamp:
+                try:
+                    value = self.load(path)
+                except self.errors as e:
+                    if value is None:
+                        raise
+                    logger.error("Keeping the previous %s, %s is invalid: %s", self.what, path, e)
+                self._loaded = (stamp, value)
+        return value
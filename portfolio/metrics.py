@@ -0,0 +1,196 @@
+"""Opt-in render timing.
+
+Set ``PORTFOLIO_METRICS=1`` to time the logical blocks of the app (stylesheet,
+sidebar, each project card, each chart, each skill section, ...). With it on:
+
+- every rerun logs one structured JSON line on the ``portfolio.metrics``
+  logger, with the duration of each block that ran;
+- the durations are kept in process as rolling histograms (count, sum,
+  p50/p95) shared by all sessions;
+- if ``PORTFOLIO_METRICS_PORT`` is set, the histograms and counters are
+  served in the Prometheus text format at ``http://<host>:<port>/metrics``.
+
+When disabled, ``timed`` returns a shared no-op context manager.
+"""
+import collections
+import contextlib
+import json
+import logging
+import math
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ENABLED = os.environ.get("PORTFOLIO_METRICS", "").lower() in ("1", "true", "yes", "on")
+PORT = os.environ.get("PORTFOLIO_METRICS_PORT")
+
+# Number of recent samples per section used for the quantiles
+WINDOW = 1024
+QUANTILES = (0.5, 0.95)
+
+logger = logging.getLogger("portfolio.metrics")
+if ENABLED and not logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+
+_NOOP = contextlib.nullcontext()
+_lock = threading.Lock()
+_histograms = {}
+_counters = collections.Counter()
+_run = threading.local()
+_server = None
+
+
+class Histogram:
+    """Running count and sum plus a window of recent samples for quantiles."""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.samples = collections.deque(maxlen=WINDOW)
+
+    def observe(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.samples.append(seconds)
+
+    def quantile(self, q):
+        ordered = sorted(self.samples)
+        if not ordered:
+            return 0.0
+        # Nearest-rank quantile
+        return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+def observe(section, seconds):
+    """Record one duration for ``section``."""
+    with _lock:
+        histogram = _histograms.get(section)
+        if histogram is None:
+            histogram = _histograms[section] = Histogram()
+        histogram.observe(seconds)
+    sections = getattr(_run, "sections", None)
+    if sections is not None:
+        sections[section] = sections.get(section, 0.0) + seconds
+
+
+@contextlib.contextmanager
+def _timer(section):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(section, time.perf_counter() - start)
+
+
+def timed(section):
+    """Context manager timing a block of the app under ``section``."""
+    if not ENABLED:
+        return _NOOP
+    return _timer(section)
+
+
+def increment(name, amount=1, **labels):
+    """Add to a counter, e.g. ``increment("contact_rejected", reason="rate")``.
+
+    Counters are always kept (they are cheap) and exported with the
+    histograms.
+    """
+    key = (name, tuple(sorted(labels.items())))
+    with _lock:
+        _counters[key] += amount
+
+
+def counters():
+    """Return a snapshot of the counters as ``{(name, labels): value}``."""
+    with _lock:
+        return dict(_counters)
+
+
+def start_run():
+    """Mark the start of a script run in the current thread."""
+    if not ENABLED:
+        return
+    _serve()
+    _run.sections = {}
+    _run.start = time.perf_counter()
+
+
+def finish_run(**fields):
+    """Log the timings of the current script run as one JSON line."""
+    sections = getattr(_run, "sections", None)
+    if not ENABLED or sections is None:
+        return
+    total = time.perf_counter() - _run.start
+    _run.sections = None
+    observe("rerun", total)
+    record = {
+        "event": "rerun",
+        **fields,
+        "total_ms": round(total * 1000, 3),
+        "sections_ms": {name: round(s * 1000, 3) for name, s in sections.items()},
+    }
+    logger.info(json.dumps(record, ensure_ascii=False))
+
+
+def _label_string(labels):
+    if not labels:
+        return ""
+    body = ",".join(f'{k}="{str(v).replace(chr(34), chr(39))}"' for k, v in labels)
+    return "{" + body + "}"
+
+
+def render_prometheus():
+    """Return all metrics in the Prometheus text exposition format."""
+    lines = [
+        "# HELP portfolio_section_seconds Render time of a block of the app.",
+        "# TYPE portfolio_section_seconds summary",
+    ]
+    with _lock:
+        histograms = {name: (h.count, h.total, [h.quantile(q) for q in QUANTILES])
+                      for name, h in _histograms.items()}
+        counts = dict(_counters)
+    for name, (count, total, values) in sorted(histograms.items()):
+        for q, value in zip(QUANTILES, values):
+            lines.append(f'portfolio_section_seconds{{section="{name}",quantile="{q}"}} {value:.6f}')
+        lines.append(f'portfolio_section_seconds_sum{{section="{name}"}} {total:.6f}')
+        lines.append(f'portfolio_section_seconds_count{{section="{name}"}} {count}')
+    for (name, labels), value in sorted(counts.items()):
+        lines.append(f"portfolio_{name}_total{_label_string(labels)} {value}")
+    return "\n".join(lines) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = render_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _serve():
+    # Start the /metrics endpoint once per process
+    global _server
+    if _server is not None or not PORT:
+        return
+    with _lock:
+        if _server is not None:
+            return
+        try:
+            _server = ThreadingHTTPServer(("", int(PORT)), _MetricsHandler)
+        except OSError as e:
+            logger.warning("Cannot serve metrics on port %s: %s", PORT, e)
+            _server = False
+            return
+    threading.Thread(target=_server.serve_forever, name="metrics-http", daemon=True).start()
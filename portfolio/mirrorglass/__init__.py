@@ -0,0 +1 @@
+"""MirrorGlass: detection of duplicated and manipulated claim images."""
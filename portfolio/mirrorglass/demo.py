@@ -0,0 +1,203 @@
+"""Live MirrorGlass demo shown under the project card."""
+import io
+import time
+import zipfile
+
+import numpy as np
+import streamlit as st
+from PIL import Image
+
+from portfolio.mirrorglass import batch, metadata, texture
+from portfolio.mirrorglass.hashing import ImageHashes, hamming, hash_image
+from portfolio.mirrorglass.index import DEFAULT_MAX_DISTANCE, default_index
+
+UPLOAD_TYPES = ["jpg", "jpeg", "png", "webp", "bmp", "tif", "tiff"]
+HEATMAP_WIDTH = 1200
+# Refresh the streaming batch table at most this often (seconds)
+TABLE_REFRESH = 0.25
+
+
+@st.cache_resource(show_spinner=False)
+def get_index():
+    """The memory-mapped reference index, opened once per process."""
+    return default_index()
+
+
+@st.cache_resource(show_spinner=False)
+def get_pool():
+    """Worker processes for batch analysis, started on first use and shared."""
+    return batch.make_pool()
+
+
+@st.cache_resource(show_spinner=False)
+def get_result_cache():
+    return batch.default_cache()
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def texture_heatmap(data):
+    """Analyze an uploaded image; return the overlay as JPEG bytes and the
+    timing. Cached on the file's bytes, so reruns do not redo the work."""
+    with Image.open(io.BytesIO(data)) as image:
+        image.load()
+        start = time.perf_counter()
+        maps = texture.analyze(image)
+        elapsed = time.perf_counter() - start
+        buffer = io.BytesIO()
+        texture.overlay(image, maps, max_width=HEATMAP_WIDTH).save(buffer, "JPEG", quality=85)
+    return buffer.getvalue(), elapsed, maps.score.shape
+
+
+def _duplicates(index, data):
+    max_distance = st.slider("Maximum pHash distance (bits)", 0, 16, DEFAULT_MAX_DISTANCE, key="mirrorglass_distance")
+    with Image.open(io.BytesIO(data)) as image:
+        start = time.perf_counter()
+        hashes = hash_image(image)
+        hashed = time.perf_counter()
+    matches = index.search(hashes, max_distance)
+    searched = time.perf_counter()
+
+    st.caption(
+        " · ".join(f"{kind}: `{value:016x}`" for kind, value in hashes._asdict().items())
+        + f" — hashed in {(hashed - start) * 1000:.1f} ms, searched in {(searched - hashed) * 1000:.2f} ms"
+    )
+    if not matches:
+        st.success("No near-duplicate found in the reference set.")
+        return
+    st.warning(f"{len(matches)} near-duplicate(s) found.")
+    st.dataframe(
+        [{"image": match.name, **{f"{kind} distance": d for kind, d in match.distances._asdict().items()}}
+         for match in matches],
+        use_container_width=True, hide_index=True,
+    )
+
+
+def _texture(data):
+    try:
+        overlay, elapsed, (rows, cols) = texture_heatmap(data)
+    except ValueError as e:
+        st.error(f"The image cannot be analyzed: {e}")
+        return
+    st.image(overlay, caption=(
+        f"Texture anomaly score of {rows} x {cols} blocks (local variance, LBP, error level analysis)"
+        f" — analyzed in {elapsed * 1000:.0f} ms"
+    ))
+
+
+def _metadata(data):
+    start = time.perf_counter()
+    try:
+        record = metadata.read_metadata(io.BytesIO(data), compare_thumbnail=True)
+    except (OSError, SyntaxError, ValueError) as e:
+        st.error(f"The metadata could not be read: {e}")
+        return
+    elapsed = time.perf_counter() - start
+    anomalies = record.pop("anomalies")
+    if anomalies:
+        st.warning("Possible edit or re-save: " + ", ".join(f"`{name}`" for name in anomalies))
+    else:
+        st.success("No metadata anomaly found.")
+    st.dataframe(
+        [{"field": field, "value": "" if value is None else str(value)} for field, value in record.items()],
+        use_container_width=True, hide_index=True,
+    )
+    st.caption(f"Read from the file header in {elapsed * 1000:.1f} ms")
+
+
+def _single(index):
+    upload = st.file_uploader(
+        f"Upload an image to check it against the reference set ({len(index):,} images)",
+        type=UPLOAD_TYPES, key="mirrorglass_upload",
+    )
+    if upload is None:
+        return
+    data = upload.getvalue()
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            image.verify()
+    except (OSError, SyntaxError, Image.DecompressionBombError):
+        st.error("This file could not be read as an image.")
+        return
+
+    duplicates, heatmap, header = st.tabs(["Near-duplicates", "Texture heatmap", "Metadata"])
+    with duplicates:
+        _duplicates(index, data)
+    with heatmap:
+        _texture(data)
+    with header:
+        _metadata(data)
+
+
+def _batch_row(index, name, result, cached):
+    if "error" in result:
+        return {"image": name, "status": "error: " + result["error"]}
+    phash = int(result["phash"], 16)
+    matches = index.search(ImageHashes(int(result["ahash"], 16), int(result["dhash"], 16), phash))
+    return {
+        "image": name,
+        "status": "cached" if cached else "analyzed",
+        "size": f"{result['width']}x{result['height']}",
+        "texture max": result["texture_max"],
+        "suspicious blocks %": round(100 * result["suspicious_blocks"], 1),
+        "ELA mean": result["ela_mean"],
+        "JPEG quality": result["quality"],
+        "metadata flags": ", ".join(result["anomalies"]),
+        "reference matches": len(matches),
+        "phash": result["phash"],
+    }
+
+
+def _similar_within(rows):
+    # Pairs of images of the claim that are near-duplicates of each other
+    hashed = [row for row in rows if "phash" in row]
+    if len(hashed) < 2:
+        return
+    phashes = np.array([int(row["phash"], 16) for row in hashed], dtype=np.uint64)
+    distances = hamming(phashes[:, None], phashes[None, :])
+    for i, row in enumerate(hashed):
+        similar = [hashed[j]["image"] for j in np.flatnonzero(distances[i] <= DEFAULT_MAX_DISTANCE) if j != i]
+        row["similar in claim"] = ", ".join(similar)
+
+
+def _batch(index):
+    upload = st.file_uploader("Upload a claim as a zip of photos", type=["zip"], key="mirrorglass_batch_upload")
+    if upload is None:
+        return
+    state_key = f"mirrorglass_batch_{upload.file_id}"
+    table = st.empty()
+    if state_key not in st.session_state:
+        if not st.button("Analyze claim", key="mirrorglass_batch_run"):
+            return
+        rows = []
+        progress = st.progress(0.0)
+        refreshed = 0.0
+        start = time.perf_counter()
+        archive = io.BytesIO(upload.getvalue())
+        try:
+            total = batch.count_files(archive)
+        except zipfile.BadZipFile:
+            st.error("This file is not a valid zip archive.")
+            return
+        # Members are decompressed one at a time, as the pool takes them
+        for name, _, result, cached in batch.run_batch(batch.iter_files(archive), get_pool(), get_result_cache()):
+            rows.append(_batch_row(index, name, result, cached))
+            progress.progress(len(rows) / max(total, 1), text=f"{len(rows)} / {total} images")
+            if time.perf_counter() - refreshed > TABLE_REFRESH:
+                table.dataframe(rows, use_container_width=True, hide_index=True)
+                refreshed = time.perf_counter()
+        progress.empty()
+        _similar_within(rows)
+        st.session_state[state_key] = (rows, time.perf_counter() - start)
+    rows, elapsed = st.session_state[state_key]
+    table.dataframe(rows, use_container_width=True, hide_index=True)
+    st.caption(f"{len(rows)} images in {elapsed:.1f} s. Click a column header to sort.")
+
+
+def render():
+    index = get_index()
+    mode = st.radio("Mode", ["Single image", "Claim batch (zip)"], horizontal=True,
+                    key="mirrorglass_mode", label_visibility="collapsed")
+    if mode == "Single image":
+        _single(index)
+    else:
+        _batch(index)
@@ -0,0 +1,92 @@
+"""Perceptual hashes of images.
+
+Three 64-bit hashes, all computed with NumPy on a small greyscale thumbnail:
+
+- aHash: 8x8 pixels compared with their mean;
+- dHash: each pixel of a 9x8 thumbnail compared with its right neighbour;
+- pHash: the 8x8 lowest frequencies of the 2D DCT of a 32x32 thumbnail
+  compared with their median (the DC term excluded).
+
+Near-duplicate images (re-encoded, resized, lightly edited) have hashes a
+small Hamming distance apart.
+"""
+from typing import NamedTuple
+
+import numpy as np
+
+HASH_BITS = 64
+PHASH_SIZE = 32
+
+
+class ImageHashes(NamedTuple):
+    ahash: int
+    dhash: int
+    phash: int
+
+
+def _dct_matrix(n):
+    # Orthonormal DCT-II basis: dct(x) == C @ x
+    k = np.arange(n)[:, None]
+    i = np.arange(n)[None, :]
+    matrix = np.cos(np.pi * (2 * i + 1) * k / (2 * n)) * np.sqrt(2 / n)
+    matrix[0] /= np.sqrt(2)
+    return matrix
+
+
+_DCT = _dct_matrix(PHASH_SIZE)
+
+
+def _pack(bits):
+    # 64 booleans -> one unsigned 64-bit integer, first bit most significant
+    return int(np.packbits(bits.ravel()).view(">u8")[0])
+
+
+def _pixels(grey, size):
+    from PIL import Image
+
+    return np.asarray(grey.resize(size, Image.BILINEAR), dtype=np.float32)
+
+
+def ahash(grey):
+    pixels = _pixels(grey, (8, 8))
+    return _pack(pixels > pixels.mean())
+
+
+def dhash(grey):
+    pixels = _pixels(grey, (9, 8))
+    return _pack(pixels[:, 1:] > pixels[:, :-1])
+
+
+def phash(grey):
+    pixels = _pixels(grey, (PHASH_SIZE, PHASH_SIZE))
+    low = (_DCT @ pixels @ _DCT.T)[:8, :8]
+    return _pack(low > np.median(low.ravel()[1:]))
+
+
+def hash_image(image):
+    """Return the three hashes of a PIL image.
+
+    An image that is not loaded yet is decoded at reduced size where the
+    format allows it (JPEG decodes at 1/2 to 1/8 scale), which is most of
+    the cost for large photos.
+    """
+    image.draft("L", (4 * PHASH_SIZE, 4 * PHASH_SIZE))
+    grey = image.convert("L")
+    return ImageHashes(ahash(grey), dhash(grey), phash(grey))
+
+
+def hash_file(path):
+    from PIL import Image
+
+    with Image.open(path) as image:
+        return hash_image(image)
+
+
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def hamming(a, b):
+    """Hamming distances between uint64 hashes (arrays or scalars)."""
+    x = np.bitwise_xor(np.asarray(a, dtype=np.uint64), np.asarray(b, dtype=np.uint64))
+    x = np.ascontiguousarray(x)
+    return _POPCOUNT[x.view(np.uint8)].reshape(x.shape + (8,)).sum(axis=-1, dtype=np.int64)
@@ -0,0 +1,199 @@
+"""Persistent Hamming-distance index of image hashes.
+
+Lookups use multi-index hashing on the 64-bit pHash: the hash is split into
+four 16-bit substrings, each with its own table mapping a substring value to
+the ids having it. Two hashes at most ``r`` bits apart agree within
+``r // 4`` bits on at least one substring, so a query only probes the buckets
+of each substring within that radius and verifies the few candidates with the
+full distance. The cost depends on the bucket sizes, not on the size of the
+reference set.
+
+An index is a directory of ``.npy`` arrays opened memory-mapped, so every
+worker process shares the same pages and nothing is re-hashed at startup::
+
+    python -m portfolio.mirrorglass.index photos/ more.jpg --out .cache/mirrorglass
+
+Each build is written to a new versioned subdirectory and published by
+atomically replacing the ``CURRENT`` pointer file.
+"""
+import argparse
+import hashlib
+import itertools
+import json
+import os
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+from portfolio.assets import ASSETS, CACHE_DIR, resolve
+from portfolio.mirrorglass.hashing import ImageHashes, hamming, hash_file
+
+INDEX_DIR = CACHE_DIR / "mirrorglass"
+IMAGE_SUFFIXES = (".jpg", ".jpeg", ".png", ".webp", ".bmp", ".tif", ".tiff")
+
+SUBSTRINGS = 4
+SUBSTRING_BITS = 64 // SUBSTRINGS
+BUCKETS = 1 << SUBSTRING_BITS
+# Columns of the hash matrix
+HASH_KINDS = ImageHashes._fields
+
+DEFAULT_MAX_DISTANCE = 10
+
+
+class Match(NamedTuple):
+    id: int
+    name: str
+    distances: ImageHashes  # Hamming distance per hash kind
+
+
+def _masks(radius):
+    # All SUBSTRING_BITS-bit masks with at most ``radius`` bits set
+    masks = [0]
+    for r in range(1, radius + 1):
+        for bits in itertools.combinations(range(SUBSTRING_BITS), r):
+            masks.append(sum(1 << b for b in bits))
+    return np.array(masks, dtype=np.int64)
+
+
+def _substrings(values):
+    values = np.asarray(values, dtype=np.uint64)
+    shifts = np.arange(SUBSTRINGS - 1, -1, -1, dtype=np.uint64) * np.uint64(SUBSTRING_BITS)
+    return ((values[..., None] >> shifts) & np.uint64(BUCKETS - 1)).astype(np.int64)
+
+
+class HashIndex:
+    """Multi-index hashing over the pHash column of an ``(n, 3)`` hash matrix."""
+
+    def __init__(self, hashes, names, tables, offsets):
+        self.hashes = hashes
+        self.names = names
+        self.tables = tables
+        self.offsets = offsets
+        self._masks = {}
+
+    @classmethod
+    def build(cls, hashes, names):
+        hashes = np.asarray(hashes, dtype=np.uint64).reshape(-1, len(HASH_KINDS))
+        keys = _substrings(hashes[:, HASH_KINDS.index("phash")]).T
+        tables = np.empty(keys.shape, dtype=np.uint32)
+        offsets = np.empty((SUBSTRINGS, BUCKETS + 1), dtype=np.int64)
+        for j, column in enumerate(keys):
+            tables[j] = np.argsort(column, kind="stable")
+            offsets[j] = np.searchsorted(column[tables[j]], np.arange(BUCKETS + 1))
+        return cls(hashes, list(names), tables, offsets)
+
+    def __len__(self):
+        return len(self.names)
+
+    def save(self, directory=INDEX_DIR):
+        """Write the index as a new version and make it current."""
+        directory = Path(directory)
+        digest = hashlib.sha256(np.ascontiguousarray(self.hashes).tobytes())
+        digest.update(json.dumps(self.names).encode("utf-8"))
+        version = digest.hexdigest()[:16]
+        target = directory / version
+        if not target.exists():
+            tmp = directory / f".{version}.{os.getpid()}.tmp"
+            tmp.mkdir(parents=True, exist_ok=True)
+            np.save(tmp / "hashes.npy", self.hashes)
+            np.save(tmp / "tables.npy", self.tables)
+            np.save(tmp / "offsets.npy", self.offsets)
+            (tmp / "names.json").write_text(json.dumps(self.names, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, target)
+        pointer = directory / f"CURRENT.{os.getpid()}.tmp"
+        pointer.write_text(version, encoding="utf-8")
+        os.replace(pointer, directory / "CURRENT")
+        return target
+
+    @classmethod
+    def open(cls, directory=INDEX_DIR):
+        """Open the current version memory-mapped; raises OSError if none."""
+        directory = Path(directory)
+        path = directory / (directory / "CURRENT").read_text(encoding="utf-8").strip()
+        names = json.loads((path / "names.json").read_text(encoding="utf-8"))
+        return cls(
+            np.load(path / "hashes.npy", mmap_mode="r"),
+            names,
+            np.load(path / "tables.npy", mmap_mode="r"),
+            np.load(path / "offsets.npy", mmap_mode="r"),
+        )
+
+    def _candidates(self, phash, max_distance):
+        radius = max_distance // SUBSTRINGS
+        masks = self._masks.get(radius)
+        if masks is None:
+            masks = self._masks[radius] = _masks(radius)
+        # Bucket ranges of every probe in every table, gathered in one go
+        n = self.tables.shape[1]
+        probes = _substrings(phash)[:, None] ^ masks
+        rows = np.arange(SUBSTRINGS)[:, None]
+        starts = (self.offsets[rows, probes] + rows * n).ravel()
+        lengths = (self.offsets[rows, probes + 1] + rows * n).ravel() - starts
+        total = int(lengths.sum())
+        if not total:
+            return np.empty(0, dtype=np.int64)
+        positions = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(total)
+        return np.unique(self.tables.reshape(-1)[positions])
+
+    def search(self, hashes, max_distance=DEFAULT_MAX_DISTANCE, limit=20):
+        """Return the entries whose pHash is within ``max_distance`` bits of
+        ``hashes.phash``, closest first."""
+        ids = self._candidates(hashes.phash, max_distance)
+        if not len(ids):
+            return []
+        candidates = np.asarray(self.hashes[ids])
+        distances = hamming(candidates, np.array(hashes, dtype=np.uint64))
+        phash_distance = distances[:, HASH_KINDS.index("phash")]
+        keep = np.flatnonzero(phash_distance <= max_distance)
+        keep = keep[np.argsort(phash_distance[keep] * 256 + distances[keep].sum(axis=1), kind="stable")][:limit]
+        return [
+            Match(int(ids[i]), self.names[ids[i]], ImageHashes(*(int(d) for d in distances[i])))
+            for i in keep
+        ]
+
+
+def image_files(paths):
+    """Expand directories into the image files they contain."""
+    for path in map(Path, paths):
+        if path.is_dir():
+            yield from sorted(p for p in path.rglob("*") if p.suffix.lower() in IMAGE_SUFFIXES)
+        else:
+            yield path
+
+
+def build_index(paths):
+    """Hash image files into a new index; unreadable files are skipped."""
+    hashes, names = [], []
+    for path in image_files(paths):
+        try:
+            hashes.append(tuple(hash_file(path)))
+        except OSError:
+            continue
+        names.append(str(path))
+    return HashIndex.build(np.array(hashes, dtype=np.uint64), names)
+
+
+def default_index(directory=INDEX_DIR):
+    """Open the index, first building one of the app's own images if none exists."""
+    try:
+        return HashIndex.open(directory)
+    except OSError:
+        index = build_index(resolve(path) for path in ASSETS)
+        # Store the names relative to the app, as they are shown to visitors
+        index.names = [Path(name).name for name in index.names]
+        index.save(directory)
+        return HashIndex.open(directory)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the MirrorGlass image hash index.")
+    parser.add_argument("paths", nargs="+", help="image files or directories")
+    parser.add_argument("--out", default=str(INDEX_DIR), help=f"index directory (default: {INDEX_DIR})")
+    args = parser.parse_args(argv)
+    index = build_index(args.paths)
+    print(f"{len(index)} images -> {index.save(args.out)}")
+
+
+if __name__ == "__main__":
+    main()
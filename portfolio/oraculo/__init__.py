@@ -0,0 +1 @@
+"""Oráculo: retrieval over company documents."""
@@ -0,0 +1,34 @@
+"""Splitting documents into retrieval chunks.
+
+Paragraphs are packed into chunks of at most ``MAX_WORDS`` words; a longer
+paragraph is cut into windows that overlap by ``OVERLAP`` words, so a
+sentence on a boundary is whole in at least one chunk.
+"""
+import re
+
+MAX_WORDS = 200
+OVERLAP = 40
+
+_PARAGRAPH = re.compile(r"\n\s*\n")
+
+
+def chunk_text(text, max_words=MAX_WORDS, overlap=OVERLAP):
+    """Return the chunks of ``text``, as strings."""
+    chunks, current, length = [], [], 0
+    for paragraph in _PARAGRAPH.split(text):
+        paragraph_words = paragraph.split()
+        if not paragraph_words:
+            continue
+        if length + len(paragraph_words) > max_words and current:
+            chunks.append("\n\n".join(current))
+            current, length = [], 0
+        if len(paragraph_words) <= max_words:
+            current.append(" ".join(paragraph_words))
+            length += len(paragraph_words)
+            continue
+        step = max(1, max_words - overlap)
+        for start in range(0, len(paragraph_words) - overlap, step):
+            chunks.append(" ".join(paragraph_words[start:start + max_words]))
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
@@ -0,0 +1,44 @@
+"""Live Oráculo demo shown under the project card."""
+import time
+
+import streamlit as st
+
+from portfolio.oraculo.embedding import make_embedder
+from portfolio.oraculo.index import default_index
+
+RESULTS = 5
+
+
+@st.cache_resource(show_spinner=False)
+def get_embedder():
+    return make_embedder()
+
+
+@st.cache_resource(show_spinner=False)
+def get_index():
+    """The memory-mapped index of this portfolio's content, built on first use."""
+    return default_index(get_embedder())
+
+
+def render():
+    question = st.text_input(
+        "Ask a question about this portfolio", key="oraculo_question",
+        placeholder="e.g. How are fraudulent claim photos detected?",
+    )
+    if not question.strip():
+        return
+    with st.spinner("Indexing the portfolio…"):
+        index = get_index()
+    start = time.perf_counter()
+    hits = index.query(get_embedder(), question, k=RESULTS)
+    elapsed = time.perf_counter() - start
+    st.caption(f"{len(index)} chunks of {len(index.sources)} documents searched in {elapsed * 1000:.2f} ms "
+               f"({index.meta['embedder']} embeddings)")
+    hits = [hit for hit in hits if hit.score > 0]
+    if not hits:
+        st.info("No passage matches this question.")
+        return
+    for hit in hits:
+        with st.container(border=True):
+            st.markdown(f"**{hit.source}** · similarity {hit.score:.2f}")
+            st.write(hit.text)
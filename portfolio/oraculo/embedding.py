@@ -0,0 +1,92 @@
+"""Text embeddings for retrieval.
+
+``PORTFOLIO_EMBEDDER`` selects the embedder:
+
+- ``hashing`` (default): a hashing vectorizer with no model and no extra
+  dependency. Words and word pairs are hashed into ``DIM`` signed buckets,
+  weighted by ``1 + log(count)`` and L2-normalized, so the dot product of two
+  vectors is their cosine similarity on shared terms;
+- ``sentence-transformers[:<model>]``: a CPU sentence-embedding model, if the
+  ``sentence-transformers`` package is installed.
+
+Every embedder has a ``name`` (stored with an index, which only accepts
+queries embedded the same way), a ``dim`` and ``embed(texts)``, which returns
+an ``(n, dim)`` float32 array of unit vectors.
+"""
+import os
+import re
+import unicodedata
+import zlib
+
+import numpy as np
+
+DIM = 384
+DEFAULT_MODEL = "all-MiniLM-L6-v2"
+
+_WORD = re.compile(r"\w+")
+# Frequent words of the supported languages (English, Portuguese, French)
+STOPWORDS = frozenset("""
+a an and are as at be by for from has have in is it of on or that the this to was were will with what how
+o os as um uma de do da dos das e em no na nos nas por para com que se ao aos
+le la les un une des du et en est pour par sur au aux qui que dans ce ces
+""".split())
+
+
+def tokens(text):
+    """Lowercase words without accents or stopwords."""
+    folded = unicodedata.normalize("NFKD", text.casefold())
+    folded = "".join(c for c in folded if not unicodedata.combining(c))
+    return [word for word in _WORD.findall(folded) if word not in STOPWORDS]
+
+
+class HashingEmbedder:
+    """Signed feature hashing of words and word pairs."""
+
+    def __init__(self, dim=DIM):
+        self.dim = dim
+        self.name = f"hashing-{dim}"
+
+    def _features(self, text):
+        words = tokens(text)
+        features = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+        return np.array([zlib.crc32(feature.encode("utf-8")) for feature in features], dtype=np.uint32)
+
+    def embed(self, texts):
+        hashes = [self._features(text) for text in texts]
+        rows = np.repeat(np.arange(len(hashes)), [len(h) for h in hashes])
+        hashes = np.concatenate(hashes) if hashes else np.empty(0, dtype=np.uint32)
+        # Count each (text, bucket, sign) once, then weight the counts
+        cells = (rows * self.dim + hashes % self.dim) * 2 + (hashes >> 31)
+        cells, counts = np.unique(cells, return_counts=True)
+        weights = (1 + np.log(counts)) * np.where(cells % 2, -1.0, 1.0)
+        vectors = np.bincount(cells // 2, weights, minlength=len(texts) * self.dim)
+        vectors = vectors.reshape(len(texts), self.dim).astype(np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+
+class SentenceTransformerEmbedder:
+    """A sentence-transformers model, run on the CPU."""
+
+    def __init__(self, model=DEFAULT_MODEL):
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError:
+            raise ValueError("the sentence-transformers package is not installed") from None
+        self._model = SentenceTransformer(model, device="cpu")
+        self.dim = self._model.get_sentence_embedding_dimension()
+        self.name = f"sentence-transformers:{model}"
+
+    def embed(self, texts):
+        return self._model.encode(list(texts), normalize_embeddings=True, convert_to_numpy=True).astype(np.float32)
+
+
+def make_embedder(spec=None):
+    """Build the embedder described by ``spec`` (see the module docstring)."""
+    spec = spec or os.environ.get("PORTFOLIO_EMBEDDER") or "hashing"
+    name, _, option = spec.partition(":")
+    if name == "hashing":
+        return HashingEmbedder(int(option) if option else DIM)
+    if name == "sentence-transformers":
+        return SentenceTransformerEmbedder(option or DEFAULT_MODEL)
+    raise ValueError(f"unknown embedder: {spec}")
@@ -0,0 +1,133 @@
+"""Text extraction from source documents.
+
+Plain text, Markdown and HTML are read with the standard library, as are
+Word ``.docx`` files (a zip of XML parts). PDF needs the ``pypdf`` package and
+images are read by OCR with ``pytesseract`` (and the ``tesseract`` program);
+without them those files raise ``ExtractError``.
+"""
+import io
+import re
+import zipfile
+from html.parser import HTMLParser
+from pathlib import PurePath
+from xml.etree import ElementTree
+
+TEXT_SUFFIXES = (".txt", ".md")
+HTML_SUFFIXES = (".html", ".htm")
+IMAGE_SUFFIXES = (".png", ".jpg", ".jpeg", ".tif", ".tiff")
+SUFFIXES = TEXT_SUFFIXES + HTML_SUFFIXES + (".docx", ".pdf") + IMAGE_SUFFIXES
+# Languages passed to tesseract
+OCR_LANGUAGES = "eng+por+fra"
+
+_WORD_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_BLANK_LINES = re.compile(r"\n\s*\n\s*")
+
+
+class ExtractError(ValueError):
+    """The file cannot be read, or its format needs a package that is not installed."""
+
+
+class MissingDependency(ExtractError):
+    """The format needs a package or program that is not installed."""
+
+
+class _HTMLText(HTMLParser):
+    # Text of an HTML page, a paragraph per block element
+    SKIP = {"script", "style", "noscript", "template", "head"}
+    BLOCKS = {"p", "div", "br", "li", "tr", "h1", "h2", "h3", "h4", "h5", "h6", "section", "article", "pre",
+              "blockquote", "table", "ul", "ol"}
+
+    def __init__(self):
+        super().__init__()
+        self.parts = []
+        self._skipping = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIP:
+            self._skipping += 1
+        elif tag in self.BLOCKS:
+            self.parts.append("\n\n")
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIP:
+            self._skipping = max(0, self._skipping - 1)
+        elif tag in self.BLOCKS:
+            self.parts.append("\n\n")
+
+    def handle_data(self, data):
+        if not self._skipping:
+            self.parts.append(data)
+
+
+def _decode(data):
+    for encoding in ("utf-8-sig", "cp1252"):
+        try:
+            return data.decode(encoding)
+        except UnicodeDecodeError:
+            pass
+    return data.decode("latin-1")
+
+
+def html_text(data):
+    parser = _HTMLText()
+    parser.feed(_decode(data))
+    parser.close()
+    return _BLANK_LINES.sub("\n\n", "".join(parser.parts)).strip()
+
+
+def docx_text(data):
+    try:
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            root = ElementTree.fromstring(archive.read("word/document.xml"))
+    except (zipfile.BadZipFile, KeyError, ElementTree.ParseError) as e:
+        raise ExtractError(f"not a Word document: {e}") from None
+    paragraphs = ("".join(node.text or "" for node in paragraph.iter(_WORD_NS + "t"))
+                  for paragraph in root.iter(_WORD_NS + "p"))
+    return "\n\n".join(paragraph for paragraph in paragraphs if paragraph.strip())
+
+
+def pdf_text(data):
+    try:
+        from pypdf import PdfReader
+        from pypdf.errors import PdfReadError
+    except ImportError:
+        raise MissingDependency("reading PDF needs the pypdf package") from None
+    try:
+        return "\n\n".join(page.extract_text() or "" for page in PdfReader(io.BytesIO(data)).pages)
+    except PdfReadError as e:
+        raise ExtractError(f"not a PDF document: {e}") from None
+
+
+def image_text(data):
+    try:
+        import pytesseract
+    except ImportError:
+        raise MissingDependency("OCR needs the pytesseract package") from None
+    from PIL import Image
+
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            return pytesseract.image_to_string(image, lang=OCR_LANGUAGES)
+    except pytesseract.TesseractNotFoundError:
+        raise MissingDependency("OCR needs the tesseract program") from None
+    except OSError as e:
+        raise ExtractError(f"not an image: {e}") from None
+    except pytesseract.TesseractError as e:
+        raise ExtractError(f"OCR failed: {e}") from None
+
+
+def extract(name, data):
+    """Text of the file ``name`` with content ``data``; the format is
+    chosen by the suffix of ``name``."""
+    suffix = PurePath(name).suffix.lower()
+    if suffix in TEXT_SUFFIXES:
+        return _decode(data)
+    if suffix in HTML_SUFFIXES:
+        return html_text(data)
+    if suffix == ".docx":
+        return docx_text(data)
+    if suffix == ".pdf":
+        return pdf_text(data)
+    if suffix in IMAGE_SUFFIXES:
+        return image_text(data)
+    raise ExtractError(f"unsupported file type: {suffix or name}")
@@ -0,0 +1,362 @@
+"""Memory-mapped vector index of document chunks.
+
+An index is a directory of ``.npy`` arrays and a text blob, opened
+memory-mapped: every worker process of the app shares the same pages, and
+opening an index reads nothing but its small metadata. Vectors are unit
+float16 rows, so a dot product is a cosine similarity at half the memory of
+float32.
+
+A search scans int8 codes of the vectors (a scale per row), in blocks of
+``BLOCK_ROWS`` rows: NumPy converts them to float32 an order of magnitude
+faster than float16. The best ``RERANK`` candidates are then rescored with
+their float16 vectors; ``exact=True`` scans the float16 vectors instead.
+From ``IVF_MIN_ROWS`` rows, the build clusters the vectors with spherical
+k-means and stores them grouped by cluster (an inverted file); a query then
+scores the centroids and scans only the rows of its ``probes`` nearest
+clusters, which are contiguous on disk.
+
+Each build is written to a new versioned subdirectory and published by
+atomically replacing the ``CURRENT`` pointer file::
+
+    python -m portfolio.oraculo.index docs/ --out .cache/oraculo
+"""
+import argparse
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+from portfolio.oraculo.chunking import chunk_text
+from portfolio.oraculo.embedding import make_embedder
+
+BLOCK_ROWS = 16384
+IVF_MIN_ROWS = 50_000
+MAX_LISTS = 4096
+DEFAULT_PROBES = 8
+KMEANS_ITERATIONS = 8
+KMEANS_SAMPLE = 65536
+# Candidates of an inverted-file scan rescored with the float16 vectors
+RERANK = 64
+TEXT_SUFFIXES = (".txt", ".md")
+EMBED_BATCH = 256
+
+
+class Hit(NamedTuple):
+    score: float
+    row: int
+    source: str
+    text: str
+
+
+def default_dir():
+    from portfolio.assets import CACHE_DIR
+
+    return CACHE_DIR / "oraculo"
+
+
+def _top_k(scores, k):
+    # Indices of the k highest scores of each row, best first
+    k = min(k, scores.shape[1])
+    if not k:
+        return np.empty((len(scores), 0), dtype=np.int64)
+    best = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    order = np.argsort(-np.take_along_axis(scores, best, axis=1), axis=1, kind="stable")
+    return np.take_along_axis(best, order, axis=1)
+
+
+def _assign(vectors, centroids):
+    # Nearest centroid of each row, in blocks
+    labels = np.empty(len(vectors), dtype=np.int64)
+    for start in range(0, len(vectors), BLOCK_ROWS):
+        block = np.asarray(vectors[start:start + BLOCK_ROWS], dtype=np.float32)
+        labels[start:start + len(block)] = np.argmax(block @ centroids.T, axis=1)
+    return labels
+
+
+def kmeans(vectors, lists, iterations=KMEANS_ITERATIONS, sample=KMEANS_SAMPLE, seed=0):
+    """Spherical k-means centroids of a sample of the rows."""
+    rng = np.random.default_rng(seed)
+    rows = rng.choice(len(vectors), min(sample, len(vectors)), replace=False)
+    data = np.asarray(vectors[np.sort(rows)], dtype=np.float32)
+    centroids = data[rng.choice(len(data), lists, replace=False)]
+    for _ in range(iterations):
+        labels = _assign(data, centroids)
+        order = np.argsort(labels, kind="stable")
+        present, starts = np.unique(labels[order], return_index=True)
+        sums = np.add.reduceat(data[order], starts, axis=0)
+        # Clusters left empty keep their centroid
+        centroids[present] = sums / np.maximum(np.linalg.norm(sums, axis=1, keepdims=True), 1e-12)
+    return centroids
+
+
+def quantize(vectors):
+    """int8 codes and float32 scales with ``codes * scales ~= vectors``."""
+    codes = np.empty(vectors.shape, dtype=np.int8)
+    scales = np.empty(len(vectors), dtype=np.float32)
+    for start in range(0, len(vectors), BLOCK_ROWS):
+        block = np.asarray(vectors[start:start + BLOCK_ROWS], dtype=np.float32)
+        scale = np.maximum(np.abs(block).max(axis=1), 1e-12) / 127
+        codes[start:start + len(block)] = np.rint(block / scale[:, None])
+        scales[start:start + len(block)] = scale
+    return codes, scales
+
+
+class VectorIndex:
+    """Chunk vectors with their texts and sources, optionally clustered."""
+
+    def __init__(self, vectors, text_offsets, texts, chunk_sources, sources, meta,
+                 centroids=None, list_offsets=None, codes=None, scales=None):
+        self.vectors = vectors
+        self.text_offsets = text_offsets
+        self.texts = texts
+        self.chunk_sources = chunk_sources
+        self.sources = sources
+        self.meta = meta
+        self.centroids = centroids
+        self.list_offsets = list_offsets
+        self.codes = codes
+        self.scales = scales
+        # Boolean mask of the rows that can be returned, or None for all
+        self.live = None
+
+    @classmethod
+    def build(cls, vectors, texts, chunk_sources, sources, embedder_name, lists=None):
+        """Build an index of unit ``vectors`` and the chunk ``texts``;
+        ``chunk_sources[i]`` is the position of chunk i's source in ``sources``."""
+        vectors = np.asarray(vectors, dtype=np.float16)
+        chunk_sources = np.asarray(chunk_sources, dtype=np.int32)
+        count = len(vectors)
+        if lists is None and count >= IVF_MIN_ROWS:
+            lists = min(MAX_LISTS, int(np.sqrt(count)))
+        centroids = list_offsets = None
+        order = np.arange(count)
+        if lists:
+            centroids = kmeans(vectors, lists)
+            labels = _assign(vectors, centroids)
+            order = np.argsort(labels, kind="stable")
+            list_offsets = np.searchsorted(labels[order], np.arange(lists + 1))
+        encoded = [texts[i].encode("utf-8") for i in order]
+        text_offsets = np.zeros(count + 1, dtype=np.int64)
+        np.cumsum([len(text) for text in encoded], out=text_offsets[1:])
+        meta = {"embedder": embedder_name, "dim": int(vectors.shape[1]) if count else 0, "count": count,
+                "lists": int(lists or 0)}
+        vectors = vectors[order]
+        codes, scales = quantize(vectors)
+        return cls(vectors, text_offsets, np.frombuffer(b"".join(encoded), dtype=np.uint8),
+                   chunk_sources[order], list(sources), meta, centroids, list_offsets, codes, scales)
+
+    def __len__(self):
+        return self.meta["count"]
+
+    def save(self, directory):
+        """Write the index as a new version and make it current."""
+        directory = Path(directory)
+        target = self.write(directory)
+        pointer = directory / f"CURRENT.{os.getpid()}.tmp"
+        pointer.write_text(target.name, encoding="utf-8")
+        os.replace(pointer, directory / "CURRENT")
+        return target
+
+    def write(self, directory):
+        """Write the index as a version subdirectory of ``directory``; return its path."""
+        directory = Path(directory)
+        digest = hashlib.sha256(np.ascontiguousarray(self.vectors).tobytes())
+        digest.update(np.asarray(self.texts).tobytes())
+        digest.update(json.dumps([self.sources, self.meta]).encode("utf-8"))
+        version = digest.hexdigest()[:16]
+        target = directory / version
+        if not target.exists():
+            tmp = directory / f".{version}.{os.getpid()}.tmp"
+            tmp.mkdir(parents=True, exist_ok=True)
+            np.save(tmp / "vectors.npy", self.vectors)
+            np.save(tmp / "text_offsets.npy", self.text_offsets)
+            np.save(tmp / "texts.npy", self.texts)
+            np.save(tmp / "chunk_sources.npy", self.chunk_sources)
+            if self.centroids is not None:
+                np.save(tmp / "centroids.npy", self.centroids)
+                np.save(tmp / "list_offsets.npy", self.list_offsets)
+            if self.codes is not None:
+                np.save(tmp / "codes.npy", self.codes)
+                np.save(tmp / "scales.npy", self.scales)
+            (tmp / "sources.json").write_text(json.dumps(self.sources, ensure_ascii=False), encoding="utf-8")
+            (tmp / "meta.json").write_text(json.dumps(self.meta), encoding="utf-8")
+            os.replace(tmp, target)
+        return target
+
+    @classmethod
+    def open(cls, directory):
+        """Open the current version memory-mapped; raises OSError if none."""
+        directory = Path(directory)
+        path = directory / (directory / "CURRENT").read_text(encoding="utf-8").strip()
+        return cls.open_version(path)
+
+    @classmethod
+    def open_version(cls, path):
+        path = Path(path)
+        meta = json.loads((path / "meta.json").read_text(encoding="utf-8"))
+        clustered = meta["lists"] > 0
+        quantized = (path / "codes.npy").exists()
+        return cls(
+            np.load(path / "vectors.npy", mmap_mode="r"),
+            np.load(path / "text_offsets.npy", mmap_mode="r"),
+            np.load(path / "texts.npy", mmap_mode="r"),
+            np.load(path / "chunk_sources.npy", mmap_mode="r"),
+            json.loads((path / "sources.json").read_text(encoding="utf-8")),
+            meta,
+            np.load(path / "centroids.npy") if clustered else None,
+            np.load(path / "list_offsets.npy") if clustered else None,
+            np.load(path / "codes.npy", mmap_mode="r") if quantized else None,
+            np.load(path / "scales.npy", mmap_mode="r") if quantized else None,
+        )
+
+    def text(self, row):
+        start, end = self.text_offsets[row], self.text_offsets[row + 1]
+        return bytes(self.texts[start:end]).decode("utf-8")
+
+    def source(self, row):
+        return self.sources[self.chunk_sources[row]]
+
+    def _exact(self, queries, k):
+        best_rows = np.empty((len(queries), 0), dtype=np.int64)
+        best_scores = np.empty((len(queries), 0), dtype=np.float32)
+        for start in range(0, len(self), BLOCK_ROWS):
+            block = np.asarray(self.vectors[start:start + BLOCK_ROWS], dtype=np.float32)
+            block_scores = queries @ block.T
+            if self.live is not None:
+                block_scores[:, ~self.live[start:start + len(block)]] = -np.inf
+            scores = np.concatenate([best_scores, block_scores], axis=1)
+            block_rows = np.broadcast_to(np.arange(start, start + len(block)), (len(queries), len(block)))
+            rows = np.concatenate([best_rows, block_rows], axis=1)
+            keep = _top_k(scores, k)
+            best_scores = np.take_along_axis(scores, keep, axis=1)
+            best_rows = np.take_along_axis(rows, keep, axis=1)
+        return np.where(np.isneginf(best_scores), -1, best_rows), best_scores
+
+    def _scanned(self, query, k, ranges):
+        rows, approximate = [], []
+        for start, end in ranges:
+            for block in range(start, end, BLOCK_ROWS):
+                stop = min(end, block + BLOCK_ROWS)
+                block_rows, codes = np.arange(block, stop), self.codes[block:stop]
+                if self.live is not None:
+                    keep = self.live[block:stop]
+                    block_rows, codes = block_rows[keep], codes[keep]
+                rows.append(block_rows)
+                approximate.append((codes.astype(np.float32) @ query) * self.scales[block_rows])
+        rows = np.concatenate(rows) if rows else np.empty(0, dtype=np.int64)
+        if not len(rows):
+            return rows, np.empty(0, dtype=np.float32)
+        approximate = np.concatenate(approximate)
+        candidates = np.sort(rows[_top_k(approximate[None], max(k, RERANK))[0]])
+        scores = np.asarray(self.vectors[candidates], dtype=np.float32) @ query
+        keep = _top_k(scores[None], k)[0]
+        return candidates[keep], scores[keep]
+
+    def search(self, queries, k=5, probes=DEFAULT_PROBES, exact=False):
+        """Return ``(rows, scores)``, each ``(len(queries), <=k)``, best first.
+
+        ``queries`` are unit vectors, ``(n, dim)`` or ``(dim,)``. Clustered
+        indexes scan the ``probes`` nearest clusters unless ``exact``. Rows
+        outside ``live``, or missing, are -1.
+        """
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+        if not len(self):
+            return np.empty((len(queries), 0), dtype=np.int64), np.empty((len(queries), 0), dtype=np.float32)
+        if self.codes is None or exact:
+            return self._exact(queries, k)
+        results = []
+        for query in queries:
+            ranges = [(0, len(self))]
+            if self.centroids is not None:
+                lists = np.sort(_top_k((self.centroids @ query)[None], probes)[0])
+                ranges = [(self.list_offsets[i], self.list_offsets[i + 1]) for i in lists]
+            results.append(self._scanned(query, k, ranges))
+        width = max(len(rows) for rows, _ in results)
+        rows = np.full((len(queries), width), -1, dtype=np.int64)
+        scores = np.full((len(queries), width), -np.inf, dtype=np.float32)
+        for i, (found, found_scores) in enumerate(results):
+            rows[i, :len(found)] = found
+            scores[i, :len(found)] = found_scores
+        return rows, scores
+
+    def query(self, embedder, text, k=5, **options):
+        """Embed ``text`` and return its best ``Hit``s."""
+        if embedder.name != self.meta["embedder"]:
+            raise ValueError(f"the index was built with {self.meta['embedder']}, not {embedder.name}")
+        rows, scores = self.search(embedder.embed([text]), k, **options)
+        return [Hit(float(score), int(row), self.source(row), self.text(row))
+                for row, score in zip(rows[0], scores[0]) if row >= 0]
+
+
+def build_index(documents, embedder, lists=None):
+    """Chunk, embed and index ``(source, text)`` documents."""
+    texts, chunk_sources, sources = [], [], []
+    for source, text in documents:
+        chunks = chunk_text(text)
+        if chunks:
+            texts.extend(chunks)
+            chunk_sources.extend([len(sources)] * len(chunks))
+            sources.append(source)
+    vectors = np.empty((len(texts), embedder.dim), dtype=np.float16)
+    for start in range(0, len(texts), EMBED_BATCH):
+        vectors[start:start + EMBED_BATCH] = embedder.embed(texts[start:start + EMBED_BATCH])
+    return VectorIndex.build(vectors, texts, chunk_sources, sources, embedder.name, lists)
+
+
+def text_files(paths):
+    """Yield ``(name, text)`` for the text files of ``paths``."""
+    for path in map(Path, paths):
+        files = sorted(p for p in path.rglob("*") if p.suffix.lower() in TEXT_SUFFIXES) if path.is_dir() else [path]
+        for file in files:
+            yield str(file), file.read_text(encoding="utf-8", errors="replace")
+
+
+def portfolio_documents():
+    """``(source, text)`` of the portfolio's own content: projects, experience and README."""
+    from portfolio.assets import APP_DIR
+    from portfolio.content import CONTENT_PATH
+
+    data = json.loads(Path(CONTENT_PATH).read_text(encoding="utf-8"))
+    for project in data.get("projects", []):
+        parts = [project.get("summary", ""), *project.get("features", []), project.get("impact", "")]
+        yield project.get("title", project.get("key", "")), "\n\n".join(parts)
+    for job in data.get("experience", []):
+        parts = [job.get("summary", ""), *job.get("highlights", [])]
+        yield f"{job.get('title', '')} — {job.get('company', '')}", "\n\n".join(parts)
+    readme = APP_DIR / "README.md"
+    if readme.exists():
+        yield "README.md", readme.read_text(encoding="utf-8")
+
+
+def default_index(embedder, directory=None):
+    """Open the index of the portfolio's content, rebuilding it if the content
+    or the embedder changed."""
+    directory = directory or default_dir() / "portfolio"
+    documents = list(portfolio_documents())
+    digest = hashlib.sha256(json.dumps([embedder.name, documents]).encode("utf-8")).hexdigest()[:16]
+    try:
+        index = VectorIndex.open(directory)
+        if index.meta.get("documents") == digest:
+            return index
+    except OSError:
+        pass
+    index = build_index(documents, embedder)
+    index.meta["documents"] = digest
+    index.save(directory)
+    return VectorIndex.open(directory)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the Oráculo vector index of text files.")
+    parser.add_argument("paths", nargs="+", help="text files or directories")
+    parser.add_argument("--out", help="index directory (default: .cache/oraculo)")
+    args = parser.parse_args(argv)
+    index = build_index(text_files(args.paths), make_embedder())
+    print(f"{len(index)} chunks of {len(index.sources)} documents -> {index.save(args.out or default_dir())}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+"""Incremental ingestion of a document folder into a segmented index.
+
+A folder (a local stand-in for a SharePoint library) is compared with the
+manifest of the previous run. A file with the same size and mtime is skipped
+without being read; one with the same SHA-256 is only re-stamped. Only new
+and changed files are extracted and chunked (in a pool of worker processes,
+a few files at a time, so memory stays bounded) and embedded. Files that
+could not be read, or that need a package that was not installed, are
+retried on the next run; other failures only when the file changes.
+
+The new chunks of a run are written as one or more segments, each a
+``VectorIndex`` version under ``segments/``. The manifest maps every document
+to the segment holding its current chunks, so the older chunks of a changed
+or deleted document are tombstoned without rewriting their segment: a row is
+live only if the manifest still points its document at its segment. When
+there are more than ``MAX_SEGMENTS`` segments, or more than ``MAX_DEAD`` of
+the rows are tombstoned, the live rows are merged into one segment, reusing
+their stored vectors. The manifest is replaced atomically and is the commit
+point of a run::
+
+    python -m portfolio.oraculo.ingest docs/ --out .cache/oraculo/documents
+"""
+import argparse
+import concurrent.futures
+import json
+import logging
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+from portfolio.oraculo.chunking import chunk_text
+from portfolio.oraculo.embedding import make_embedder
+from portfolio.oraculo.extract import SUFFIXES, ExtractError, MissingDependency, extract
+from portfolio.oraculo.index import EMBED_BATCH, Hit, VectorIndex, default_dir
+from portfolio.store import digest
+from portfolio.workers import DEFAULT_WORKERS, MAX_IN_FLIGHT, make_pool
+
+MANIFEST = "manifest.json"
+MAX_FILE_BYTES = 200 << 20
+# Chunks per segment written by a run
+SEGMENT_ROWS = 50_000
+MAX_SEGMENTS = 8
+# Share of tombstoned rows that triggers a merge
+MAX_DEAD = 0.3
+
+logger = logging.getLogger(__name__)
+
+
+class IngestStats(NamedTuple):
+    added: int
+    changed: int
+    unchanged: int
+    deleted: int
+    failed: int
+    chunks: int      # chunks embedded by this run
+    segments: int    # segments after the run
+    seconds: float
+
+
+def extract_file(path, known=None):
+    """Read, extract and chunk one file; skip the extraction if its SHA-256
+    is ``known``. Runs in a worker process."""
+    try:
+        data = Path(path).read_bytes()
+    except OSError as e:
+        return {"sha256": None, "error": str(e), "retry": True}
+    key = digest(data)
+    if key == known:
+        return {"sha256": key, "unchanged": True}
+    try:
+        return {"sha256": key, "chunks": chunk_text(extract(path, data))}
+    except ExtractError as e:
+        return {"sha256": key, "error": str(e), "retry": isinstance(e, MissingDependency)}
+    except Exception as e:
+        # A malformed file can fail anywhere inside a third-party reader
+        return {"sha256": key, "error": f"{type(e).__name__}: {e}", "retry": False}
+
+
+def extract_files(root, files, pool, max_in_flight=MAX_IN_FLIGHT):
+    """Run ``extract_file`` on ``(name, known)`` files of ``root``; yield
+    ``(name, result)`` in completion order, with at most ``max_in_flight``
+    files submitted at a time."""
+    in_flight = {}
+
+    def completed(futures):
+        for future in futures:
+            yield in_flight.pop(future), future.result()
+
+    for name, known in files:
+        if len(in_flight) >= max_in_flight:
+            done, _ = concurrent.futures.wait(in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+            yield from completed(done)
+        in_flight[pool.submit(extract_file, str(Path(root) / name), known)] = name
+    while in_flight:
+        done, _ = concurrent.futures.wait(in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+        yield from completed(done)
+
+
+def load_manifest(directory):
+    try:
+        return json.loads((Path(directory) / MANIFEST).read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {"embedder": None, "segments": [], "documents": {}}
+
+
+def _write_manifest(directory, manifest):
+    tmp = Path(directory) / f"{MANIFEST}.{os.getpid()}.tmp"
+    tmp.write_text(json.dumps(manifest, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, Path(directory) / MANIFEST)
+
+
+def _open_segments(directory, manifest):
+    # Segments of the manifest, with the rows of their current documents live
+    documents = manifest["documents"]
+    segments = []
+    for name in manifest["segments"]:
+        index = VectorIndex.open_version(Path(directory) / "segments" / name)
+        current = np.array([documents.get(source, {}).get("segment") == name for source in index.sources], dtype=bool)
+        index.live = current[index.chunk_sources] if len(index) else np.zeros(0, dtype=bool)
+        segments.append((name, index))
+    return segments
+
+
+class _SegmentWriter:
+    """Chunks of new documents, embedded as they arrive and written as
+    segments of at most ``SEGMENT_ROWS`` rows."""
+
+    def __init__(self, directory, embedder, documents):
+        self.directory = Path(directory) / "segments"
+        self.embedder = embedder
+        self.documents = documents
+        self.names = []
+        self.chunks = 0
+        self._reset()
+
+    def _reset(self):
+        self._texts, self._chunk_sources, self._sources, self._vectors = [], [], [], []
+        self._embedded = 0
+
+    def _embed(self, everything=False):
+        while len(self._texts) - self._embedded >= (1 if everything else EMBED_BATCH):
+            batch = self._texts[self._embedded:self._embedded + EMBED_BATCH]
+            self._vectors.append(self.embedder.embed(batch).astype(np.float16))
+            self._embedded += len(batch)
+
+    def add(self, source, chunks):
+        self._texts.extend(chunks)
+        self._chunk_sources.extend([len(self._sources)] * len(chunks))
+        self._sources.append(source)
+        self.chunks += len(chunks)
+        self._embed()
+        if len(self._texts) >= SEGMENT_ROWS:
+            self.flush()
+
+    def flush(self):
+        if not self._texts:
+            return
+        self._embed(everything=True)
+        index = VectorIndex.build(np.concatenate(self._vectors), self._texts, self._chunk_sources, self._sources,
+                                  self.embedder.name)
+        name = index.write(self.directory).name
+        for source in self._sources:
+            self.documents[source]["segment"] = name
+        self.names.append(name)
+        self._reset()
+
+
+def _merge(directory, manifest, embedder_name):
+    # Write the live rows of every segment as one segment, without re-embedding
+    vectors, texts, chunk_sources, sources = [], [], [], []
+    for _, index in _open_segments(directory, manifest):
+        rows = np.flatnonzero(index.live)
+        if not len(rows):
+            continue
+        present = np.unique(np.asarray(index.chunk_sources)[rows])
+        positions = np.full(len(index.sources), -1, dtype=np.int64)
+        positions[present] = len(sources) + np.arange(len(present))
+        sources.extend(index.sources[i] for i in present)
+        chunk_sources.append(positions[np.asarray(index.chunk_sources)[rows]])
+        vectors.append(np.asarray(index.vectors[rows]))
+        texts.extend(index.text(row) for row in rows)
+    if not texts:
+        return []
+    index = VectorIndex.build(np.concatenate(vectors), texts, np.concatenate(chunk_sources), sources, embedder_name)
+    name = index.write(Path(directory) / "segments").name
+    for source in sources:
+        manifest["documents"][source]["segment"] = name
+    return [name]
+
+
+def ingest(root, directory=None, embedder=None, pool=None, workers=DEFAULT_WORKERS):
+    """Bring the index in ``directory`` up to date with the files of ``root``."""
+    start = time.perf_counter()
+    root = Path(root)
+    directory = Path(directory or default_dir() / "documents")
+    embedder = embedder or make_embedder()
+    previous = load_manifest(directory)
+    # Vectors of another embedder cannot be searched together: start over
+    old = previous["documents"] if previous["embedder"] == embedder.name else {}
+    segments = previous["segments"] if previous["embedder"] == embedder.name else []
+    documents = {}
+    counts = dict.fromkeys(("added", "changed", "unchanged", "failed"), 0)
+
+    pending = []
+    for path in sorted(root.rglob("*")):
+        if path.suffix.lower() not in SUFFIXES or not path.is_file():
+            continue
+        name = path.relative_to(root).as_posix()
+        stat = path.stat()
+        entry = old.get(name)
+        if entry and not entry.get("retry") and (entry["mtime_ns"], entry["size"]) == (stat.st_mtime_ns, stat.st_size):
+            documents[name] = entry
+            counts["unchanged"] += 1
+        elif stat.st_size > MAX_FILE_BYTES:
+            documents[name] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": None,
+                               "segment": None, "error": "file too large", "retry": False}
+            counts["failed"] += 1
+        else:
+            documents[name] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": None,
+                               "segment": None, "error": None, "retry": False}
+            pending.append((name, entry["sha256"] if entry and not entry.get("retry") else None))
+    deleted = len(old.keys() - documents.keys())
+
+    directory.mkdir(parents=True, exist_ok=True)
+    writer = _SegmentWriter(directory, embedder, documents)
+    own_pool = pool is None and bool(pending)
+    if own_pool:
+        pool = make_pool(workers)
+    try:
+        for name, result in extract_files(root, pending, pool):
+            entry = documents[name]
+            entry["sha256"] = result["sha256"]
+            if result.get("unchanged"):
+                entry.update(segment=old[name]["segment"], error=old[name].get("error"))
+                counts["unchanged"] += 1
+            elif "error" in result:
+                if result["sha256"] is None and name in old:
+                    # Unreadable for now: keep the previous version searchable
+                    entry = documents[name] = dict(old[name])
+                logger.warning("Cannot ingest %s: %s", name, result["error"])
+                entry.update(error=result["error"], retry=result["retry"])
+                counts["failed"] += 1
+            else:
+                counts["changed" if name in old else "added"] += 1
+                if result["chunks"]:
+                    writer.add(name, result["chunks"])
+        writer.flush()
+    finally:
+        if own_pool:
+            pool.shutdown()
+
+    manifest = {"embedder": embedder.name, "documents": documents}
+    referenced = {entry["segment"] for entry in documents.values()}
+    manifest["segments"] = [name for name in segments + writer.names if name in referenced]
+    live = total = 0
+    for _, index in _open_segments(directory, manifest):
+        live += int(np.count_nonzero(index.live))
+        total += len(index)
+    if len(manifest["segments"]) > MAX_SEGMENTS or (total and 1 - live / total > MAX_DEAD):
+        manifest["segments"] = _merge(directory, manifest, embedder.name)
+    _write_manifest(directory, manifest)
+
+    # Segments of the previous manifest may still be open by readers: they
+    # are removed by the next run
+    keep = set(manifest["segments"]) | set(previous["segments"])
+    for path in (directory / "segments").iterdir() if (directory / "segments").exists() else ():
+        if path.name not in keep and not path.name.startswith("."):
+            shutil.rmtree(path, ignore_errors=True)
+    return IngestStats(counts["added"], counts["changed"], counts["unchanged"], deleted, counts["failed"],
+                       writer.chunks, len(manifest["segments"]), time.perf_counter() - start)
+
+
+class SegmentedIndex:
+    """Search over the live rows of every segment of an ingested folder."""
+
+    def __init__(self, manifest, segments):
+        self.manifest = manifest
+        self.segments = segments
+
+    @classmethod
+    def open(cls, directory=None):
+        """Open the segments of the current manifest memory-mapped."""
+        directory = Path(directory or default_dir() / "documents")
+        manifest = load_manifest(directory)
+        return cls(manifest, [index for _, index in _open_segments(directory, manifest)])
+
+    def __len__(self):
+        return sum(int(np.count_nonzero(index.live)) for index in self.segments)
+
+    def query(self, embedder, text, k=5, **options):
+        """Embed ``text`` and return its best ``Hit``s across segments."""
+        if self.segments and embedder.name != self.manifest["embedder"]:
+            raise ValueError(f"the index was built with {self.manifest['embedder']}, not {embedder.name}")
+        query = embedder.embed([text])
+        hits = []
+        for index in self.segments:
+            rows, scores = index.search(query, k, **options)
+            hits.extend(Hit(float(score), int(row), index.source(row), index.text(row))
+                         for row, score in zip(rows[0], scores[0]) if row >= 0)
+        return sorted(hits, key=lambda hit: -hit.score)[:k]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Update the Oráculo index of a document folder.")
+    parser.add_argument("root", help="document folder")
+    parser.add_argument("--out", help="index directory (default: .cache/oraculo/documents)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+    stats = ingest(args.root, args.out, workers=args.workers)
+    print(f"{stats.added} added, {stats.changed} changed, {stats.unchanged} unchanged, {stats.deleted} deleted, "
+          f"{stats.failed} failed; {stats.chunks} chunks embedded, {stats.segments} segments, {stats.seconds:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+"""Page registry.
+
+Each page lives in its own module and is imported the first time it is
+rendered, so heavy dependencies such as Plotly are only loaded by the worker
+once a page that needs them is actually visited.
+"""
+import importlib
+
+# Sidebar label -> module rendering the page, in navigation order
+PAGES = {
+    "Profile": "portfolio.pages.profile",
+    "Projects": "portfolio.pages.projects",
+    "Experience": "portfolio.pages.experience",
+    "Skills": "portfolio.pages.skills",
+    "Contact": "portfolio.pages.contact",
+}
+
+
+def render(name):
+    """Import the page module on first use and render it."""
+    importlib.import_module(PAGES[name]).render()
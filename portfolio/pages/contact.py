@@ -0,0 +1,68 @@
+"""Contact page: contact details and the message form."""
+import streamlit as st
+
+from portfolio import components, contact
+from portfolio.content import get_content
+
+
+def _submit():
+    state = st.session_state
+    submission = {field: state[f"contact_{field}"] for field in contact.FIELDS}
+    state["contact_result"] = contact.submit(submission)
+
+
+def render():
+    st.markdown(components.header("Contact Information", "Let's discuss how AI can transform your business"), unsafe_allow_html=True)
+
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        st.markdown("""
+        <div class="card">
+            <h3>Contact Details</h3>
+            <p><strong>Email:</strong> viniciuspaschoa1@hotmail.com</p>
+            <p><strong>Phone:</strong> +55 (11) 93801-2431</p>
+            <p><strong>LinkedIn:</strong> <a href="https://www.linkedin.com/in/viniciuspaschoa" target="_blank" style="color: #1E40AF;">linkedin.com/in/viniciuspaschoa</a></p>
+            <p><strong>Location:</strong> Paris, Île-de-France, France</p>
+            <p><strong>Citizenship:</strong> EU Citizen</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("""
+        <div class="card">
+            <h3>Professional Interests</h3>
+            <p>I'm currently open to discussing:</p>
+            <ul>
+                <li>Business Analyst roles</li>
+                <li>Product Owner positions</li>
+                <li>Product Manager opportunities</li>
+                <li>AI Strategy consulting</li>
+                <li>Speaking engagements on AI implementation</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Languages section
+    st.markdown(get_content().languages_card_html, unsafe_allow_html=True)
+
+    # Contact form
+    st.markdown("## Send me a message")
+
+    with st.form(key="contact_form"):
+        col1, col2 = st.columns(2)
+        with col1:
+            st.text_input("Name", key="contact_name")
+        with col2:
+            st.text_input("Email", key="contact_email")
+
+        st.text_input("Subject", key="contact_subject")
+        st.text_area("Message", height=150, key="contact_message")
+
+        # The submission is checked in the callback, before the page reruns
+        st.form_submit_button("Send Message", on_click=_submit)
+
+        result = st.session_state.pop("contact_result", None)
+        if result:
+            level, text = result
+            getattr(st, level)(text)
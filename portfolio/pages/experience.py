@@ -0,0 +1,35 @@
+"""Experience page: career timeline, key achievements and skills evolution."""
+import streamlit as st
+
+from portfolio import charts, components
+from portfolio.content import get_content
+
+
+def render():
+    content = get_content()
+
+    st.markdown(components.header("Professional Experience", "My journey in applying AI to solve real business challenges"), unsafe_allow_html=True)
+
+    # Experience Timeline
+    st.markdown("## Career Timeline", unsafe_allow_html=True)
+
+    for entry in content.timeline:
+        st.markdown(entry.header_html, unsafe_allow_html=True)
+        st.markdown(entry.summary)
+        if entry.highlights_title:
+            st.markdown(f"**{entry.highlights_title}**")
+        if entry.highlights_md:
+            st.markdown(entry.highlights_md)
+
+    # Key achievements
+    st.markdown("## Key Achievements")
+
+    for column, cards_html in zip(st.columns(2), content.achievements_html):
+        with column:
+            st.markdown(cards_html, unsafe_allow_html=True)
+
+    # Skills growth visualization
+    st.markdown("## Skills Evolution")
+
+    chart = content.skills_evolution
+    charts.plotly_chart(chart.name, **chart.kwargs)
@@ -0,0 +1,48 @@
+"""Profile page: introduction, key metrics, education and languages."""
+import streamlit as st
+
+from portfolio import assets, components
+from portfolio.content import get_content
+
+
+def render():
+    content = get_content()
+
+    # Header
+    st.markdown(content.header_html, unsafe_allow_html=True)
+
+    # About section
+    st.markdown("<h2>About Me</h2>", unsafe_allow_html=True)
+
+    col1, col2 = st.columns([1, 2])
+
+    with col1:
+        # Try to load profile image
+        try:
+            st.image(assets.thumbnail("profile.jpg", 250), width=250)
+        except OSError:
+            st.markdown('<div style="display:flex; justify-content:center; font-size:100px; color:#1E40AF;">🧠</div>', unsafe_allow_html=True)
+
+    with col2:
+        st.markdown(content.about_html, unsafe_allow_html=True)
+
+    # Key metrics
+    st.markdown("<h2>Key Metrics</h2>", unsafe_allow_html=True)
+
+    # Computed from the timeline, projects, languages and education
+    key_metrics = content.summary.key_metrics()
+    for column, (value, label) in zip(st.columns(len(key_metrics)), key_metrics):
+        with column:
+            st.markdown(components.metric_box(value, label), unsafe_allow_html=True)
+
+    # Education
+    st.markdown("<h2>Education</h2>", unsafe_allow_html=True)
+
+    for column, cards_html in zip(st.columns(2), content.education_html):
+        with column:
+            st.markdown(cards_html, unsafe_allow_html=True)
+
+    # Languages
+    st.markdown("<h2>Languages</h2>", unsafe_allow_html=True)
+
+    st.markdown(content.language_bars_html, unsafe_allow_html=True)
@@ -0,0 +1,42 @@
+"""Projects page: HeatGlass, MirrorGlass, Oráculo, Fast Track and SmartCost."""
+import importlib
+
+import streamlit as st
+
+from portfolio import assets, charts, components, metrics
+from portfolio.content import get_content
+
+
+def _project(project):
+    st.markdown(project.header_html, unsafe_allow_html=True)
+
+    st.markdown(project.summary)
+
+    st.markdown("**Key Features:**", unsafe_allow_html=True)
+    st.markdown(project.features_md)
+
+    st.markdown("**Business Impact:**", unsafe_allow_html=True)
+    st.markdown(project.impact)
+
+    st.markdown(project.tags_html, unsafe_allow_html=True)
+
+    if project.screenshots:
+        for column, shot in zip(st.columns(len(project.screenshots)), project.screenshots):
+            with column:
+                st.image(assets.screenshot(shot.file, placeholder=shot.placeholder), caption=shot.caption, use_column_width=True)
+
+    if project.chart:
+        charts.plotly_chart(project.chart.name, **project.chart.kwargs)
+
+    # Demo modules are only imported once a visitor opens them
+    if project.demo and st.toggle("Try it live", key=f"demo_{project.key}"):
+        importlib.import_module(project.demo).render()
+
+
+def render():
+    # Header section
+    st.markdown(components.header("Project Portfolio", "A showcase of my AI and business transformation projects"), unsafe_allow_html=True)
+
+    for project in get_content().projects:
+        with metrics.timed(f"project:{project.key}"):
+            _project(project)
@@ -0,0 +1,46 @@
+"""Skills page: technical and business skills, certifications and tools."""
+import streamlit as st
+
+from portfolio import components, metrics
+from portfolio.content import get_content
+
+
+def _grid(items, per_row):
+    # Pair every item with a column, ``per_row`` columns to a row
+    for start in range(0, len(items), per_row):
+        yield from zip(st.columns(per_row), items[start:start + per_row])
+
+
+def _skill_groups(groups):
+    for column, group in _grid(groups, 2):
+        with column:
+            st.markdown(f"### {group.title}")
+            with metrics.timed(f"skills:{group.key}"):
+                st.markdown(group.bars_html, unsafe_allow_html=True)
+
+
+def render():
+    content = get_content()
+
+    st.markdown(components.header("Skills & Expertise", "Professional capabilities and technical competencies"), unsafe_allow_html=True)
+
+    # Technical Skills
+    st.markdown("## Technical Skills")
+    _skill_groups(content.technical_skills)
+
+    # Business Skills
+    st.markdown("## Business Skills")
+    _skill_groups(content.business_skills)
+
+    # Certifications
+    st.markdown("## Certifications")
+
+    for column, card_html in _grid(content.certifications_html, 3):
+        with column:
+            st.markdown(card_html, unsafe_allow_html=True)
+
+    # Tools & Technologies
+    st.markdown("## Tools & Technologies")
+
+    with metrics.timed("skills:technologies"):
+        st.markdown(content.technologies_html, unsafe_allow_html=True)
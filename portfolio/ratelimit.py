@@ -0,0 +1,82 @@
+"""In-process rate limiting and duplicate suppression.
+
+Both structures are bounded LRUs, so a flood of distinct clients or messages
+cannot grow them without limit, and both are safe to share between the
+script threads of all sessions.
+"""
+import collections
+import threading
+import time
+
+
+class TokenBucketLimiter:
+    """Token buckets keyed by an arbitrary hashable (session id, client IP, ...).
+
+    Each key may spend ``capacity`` requests at once; tokens refill at
+    ``rate`` per second. Idle keys are evicted least-recently-used first once
+    more than ``max_keys`` are tracked (an evicted key simply starts again
+    with a full bucket).
+    """
+
+    def __init__(self, rate, capacity, max_keys=10_000, clock=time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self.max_keys = max_keys
+        self._clock = clock
+        self._buckets = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def allow(self, key, cost=1.0, spend=True):
+        """Spend ``cost`` tokens of ``key``'s bucket; False if not enough.
+        With ``spend=False``, only check that there are enough."""
+        now = self._clock()
+        with self._lock:
+            tokens, updated = self._buckets.pop(key, (self.capacity, now))
+            tokens = min(self.capacity, tokens + (now - updated) * self.rate)
+            allowed = tokens >= cost
+            if allowed and spend:
+                tokens -= cost
+            self._buckets[key] = (tokens, now)
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return allowed
+
+    def refund(self, key, cost=1.0):
+        """Give back ``cost`` tokens spent by ``allow``."""
+        with self._lock:
+            if key in self._buckets:
+                tokens, updated = self._buckets[key]
+                self._buckets[key] = (min(self.capacity, tokens + cost), updated)
+
+    def __len__(self):
+        return len(self._buckets)
+
+
+class RecentSet:
+    """Bounded LRU set of recently seen keys (e.g. content hashes)."""
+
+    def __init__(self, max_size=4096):
+        self.max_size = max_size
+        self._keys = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def check_and_add(self, key, add=True):
+        """Return True if ``key`` was already present; remember it either way
+        (or, with ``add=False``, only if it was)."""
+        with self._lock:
+            seen = key in self._keys
+            if seen:
+                self._keys.move_to_end(key)
+            elif add:
+                self._keys[key] = None
+                if len(self._keys) > self.max_size:
+                    self._keys.popitem(last=False)
+        return seen
+
+    def discard(self, key):
+        """Forget ``key``, if present."""
+        with self._lock:
+            self._keys.pop(key, None)
+
+    def __len__(self):
+        return len(self._keys)
@@ -0,0 +1,80 @@
+"""Persistent cache of analysis results keyed by content hash.
+
+Batch analyses (MirrorGlass claim folders, HeatGlass call batches) store each
+file's result under the SHA-256 of its bytes, so a file that was analyzed
+before, by any worker process, is answered from SQLite instead of being
+decoded again. Results are JSON values grouped in namespaces; put the version
+of the analysis in the namespace so changing it invalidates old results.
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    namespace TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    created REAL NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (namespace, digest)
+) WITHOUT ROWID;
+"""
+
+
+def digest(data):
+    """Content hash used as the cache key."""
+    return hashlib.sha256(data).hexdigest()
+
+
+class ResultCache:
+    """A namespace of JSON results in a SQLite file shared between processes."""
+
+    def __init__(self, path, namespace):
+        self.path = Path(path)
+        self.namespace = namespace
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, timeout=10, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+
+    def get(self, key):
+        """Return the stored value, or None."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value FROM results WHERE namespace = ? AND digest = ?", (self.namespace, key),
+            ).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def get_many(self, keys):
+        """Return ``{key: value}`` for the keys that are stored."""
+        keys = list(dict.fromkeys(keys))
+        found = {}
+        with self._lock:
+            # Stay under SQLite's limit on bound parameters
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows = self._db.execute(
+                    f"SELECT digest, value FROM results WHERE namespace = ? AND digest IN ({','.join('?' * len(chunk))})",
+                    (self.namespace, *chunk),
+                ).fetchall()
+                found.update((key, json.loads(value)) for key, value in rows)
+        return found
+
+    def put(self, key, value):
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO results (namespace, digest, created, value) VALUES (?, ?, ?, ?)",
+                (self.namespace, key, time.time(), json.dumps(value, ensure_ascii=False)),
+            )
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM results WHERE namespace = ?", (self.namespace,)).fetchone()[0]
+
+    def close(self):
+        self._db.close()
@@ -0,0 +1,43 @@
+"""Stylesheet of the app.
+
+The CSS lives in ``style.css`` next to this module. It is read and minified
+once per process; ``inject_css`` then emits the same ``<style>`` element on
+every rerun.
+
+Streamlit drops any element a rerun does not emit again, so the stylesheet
+cannot simply be skipped after the first run of a session. Instead the app
+lowers ``global.minCachedMessageSize`` in ``.streamlit/config.toml``: the
+server then keeps this (byte-identical) message in its forward-message cache
+and, after the first run, sends the session a short hash reference instead
+of the stylesheet itself.
+"""
+import functools
+import re
+from pathlib import Path
+
+import streamlit as st
+
+STYLESHEET = Path(__file__).with_name("style.css")
+
+_COMMENTS = re.compile(r"/\*.*?\*/", re.S)
+_WHITESPACE = re.compile(r"\s+")
+_PUNCTUATION = re.compile(r"\s*([{};,>])\s*")
+
+
+def minify(css):
+    """Strip comments and redundant whitespace from a stylesheet."""
+    css = _COMMENTS.sub("", css)
+    css = _WHITESPACE.sub(" ", css)
+    css = _PUNCTUATION.sub(r"\1", css)
+    css = css.replace(": ", ":").replace(";}", "}")
+    return css.strip()
+
+
+@functools.lru_cache(maxsize=1)
+def stylesheet():
+    """Return the minified ``<style>`` element."""
+    return f"<style>{minify(STYLESHEET.read_text(encoding='utf-8'))}</style>"
+
+
+def inject_css():
+    st.markdown(stylesheet(), unsafe_allow_html=True)
@@ -0,0 +1,124 @@
+"""Batch processing of files in a pool of worker processes.
+
+``run_batch`` submits at most ``max_in_flight`` files at a time, so a large
+batch never sits in memory (or in the pool's queue) all at once, and yields
+results as soon as each file completes. Results are stored in a
+``ResultCache`` under the SHA-256 of the file, so a re-submitted file is
+answered without being analyzed again, and identical files within a batch
+are analyzed once.
+
+This module does not import Streamlit, so worker processes start quickly.
+"""
+import concurrent.futures
+import contextlib
+import functools
+import multiprocessing
+import os
+import zipfile
+from pathlib import Path
+
+from portfolio.store import digest
+
+# Limits for archives uploaded by visitors
+MAX_FILES = 500
+MAX_FILE_BYTES = 50 << 20
+DEFAULT_WORKERS = max(1, min(4, os.cpu_count() or 1))
+MAX_IN_FLIGHT = 2 * DEFAULT_WORKERS
+
+
+def _members(source, suffixes, max_files, max_file_bytes):
+    # (name, read) of the selected files of a directory or open zip archive
+    members = []
+    if isinstance(source, zipfile.ZipFile):
+        for info in source.infolist():
+            if info.is_dir() or Path(info.filename).suffix.lower() not in suffixes or info.file_size > max_file_bytes:
+                continue
+            members.append((info.filename, functools.partial(source.read, info)))
+            if len(members) >= max_files:
+                break
+        return members
+    root = Path(source)
+    for path in sorted(root.rglob("*")):
+        if path.suffix.lower() in suffixes and path.is_file() and path.stat().st_size <= max_file_bytes:
+            members.append((str(path.relative_to(root)), path.read_bytes))
+            if len(members) >= max_files:
+                break
+    return members
+
+
+def _open(source):
+    if not hasattr(source, "read") and Path(source).is_dir():
+        return contextlib.nullcontext(source)
+    return zipfile.ZipFile(source)
+
+
+def iter_files(source, suffixes, max_files=MAX_FILES, max_file_bytes=MAX_FILE_BYTES):
+    """Yield ``(name, bytes)`` for the files of a directory or zip archive.
+
+    ``source`` is a path or a file object of a zip archive. Entries without
+    one of ``suffixes``, or too large, are skipped; at most ``max_files``
+    are read, one at a time as the generator is consumed.
+    """
+    with _open(source) as opened:
+        for name, read in _members(opened, suffixes, max_files, max_file_bytes):
+            yield name, read()
+
+
+def count_files(source, suffixes, max_files=MAX_FILES, max_file_bytes=MAX_FILE_BYTES):
+    """Number of files ``iter_files`` yields, from the directory listing or
+    the archive's table of contents, without reading them."""
+    with _open(source) as opened:
+        return len(_members(opened, suffixes, max_files, max_file_bytes))
+
+
+def make_pool(workers=DEFAULT_WORKERS):
+    # Worker processes are spawned rather than forked: the app process runs
+    # server threads that a fork would copy mid-flight
+    return concurrent.futures.ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+def run_batch(analyze, files, pool, cache=None, max_in_flight=MAX_IN_FLIGHT):
+    """Run ``analyze(bytes)`` on ``(name, bytes)`` pairs; yield
+    ``(name, digest, result, cached)`` in completion order.
+
+    ``analyze`` must be a module-level function returning a JSON value; a
+    dict with an ``"error"`` key is not cached.
+    """
+    in_flight = {}
+    # Files with the same content within the batch wait for the first one
+    waiting = {}
+
+    def completed(futures):
+        for future in futures:
+            key = in_flight.pop(future)
+            result = future.result()
+            if cache is not None and "error" not in result:
+                cache.put(key, result)
+            for name in waiting.pop(key):
+                yield name, key, result, False
+
+    for name, data in files:
+        key = digest(data)
+        if key in waiting:
+            waiting[key].append(name)
+            continue
+        result = cache.get(key) if cache is not None else None
+        if result is not None:
+            yield name, key, result, True
+            continue
+        if len(in_flight) >= max_in_flight:
+            done, _ = concurrent.futures.wait(in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+            yield from completed(done)
+        waiting[key] = [name]
+        in_flight[pool.submit(analyze, data)] = key
+    while in_flight:
+        done, _ = concurrent.futures.wait(in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+        yield from completed(done)
+
+
+def default_cache(namespace):
+    """The app's result cache for ``namespace``."""
+    from portfolio.assets import CACHE_DIR
+    from portfolio.store import ResultCache
+
+    return ResultCache(CACHE_DIR / "results.sqlite3", namespace)